@@ -13,15 +13,90 @@ A production-ready blog API featuring:
 - Rate limiting
 """
 
-from flask import Flask
-from flask_jwt_extended import JWTManager
-from flask_cors import CORS
+from flask import Flask, Response, send_from_directory
 import os
+import sys
 
-from config import get_config, setup_swagger, init_limiter
+from config import (
+    get_config,
+    init_limiter,
+    init_cors,
+    CachingJWTManager,
+    AuthenticationError,
+    AuthorizationError
+)
 from db import init_db
+from middleware import init_auth
 from routes import auth_bp, users_bp, posts_bp, info_bp
-from utils import create_error_response
+from utils import create_error_response, error_body, OrjsonProvider
+
+
+# Pre-encoded bodies for errors whose message never changes
+_EXPIRED_TOKEN_BODY = error_body("Token has expired")
+_INVALID_TOKEN_BODY = error_body("Invalid token")
+_UNAUTHORIZED_BODY = error_body("Authorization required")
+_NOT_FOUND_BODY = error_body("Resource not found")
+_METHOD_NOT_ALLOWED_BODY = error_body("Method not allowed")
+_INTERNAL_ERROR_BODY = error_body("Internal server error")
+
+
+# ==================== ERROR HANDLERS ====================
+
+def expired_token_callback(jwt_header, jwt_payload):
+    return Response(_EXPIRED_TOKEN_BODY, 401, mimetype='application/json')
+
+
+def invalid_token_callback(error):
+    return Response(_INVALID_TOKEN_BODY, 401, mimetype='application/json')
+
+
+def unauthorized_callback(error):
+    return Response(_UNAUTHORIZED_BODY, 401, mimetype='application/json')
+
+
+def not_found(error):
+    return Response(_NOT_FOUND_BODY, 404, mimetype='application/json')
+
+
+def method_not_allowed(error):
+    return Response(_METHOD_NOT_ALLOWED_BODY, 405, mimetype='application/json')
+
+
+def internal_error(error):
+    return Response(_INTERNAL_ERROR_BODY, 500, mimetype='application/json')
+
+
+def authentication_error(e):
+    return create_error_response(str(e), 401)
+
+
+def authorization_error(e):
+    return create_error_response(str(e), 403)
+
+
+def ratelimit_handler(e):
+    return create_error_response(
+        f"Rate limit exceeded. {e.description}",
+        429
+    )
+
+
+# ==================== DOCUMENTATION ====================
+
+def register_static_spec(app):
+    """
+    Serve the pre-rendered OpenAPI spec (static/openapi.json)
+    
+    Used outside debug/testing so production never imports apispec or
+    rebuilds the spec per request. Generate the file with
+    `python -m config.swagger`.
+    
+    Args:
+        app: Flask application instance
+    """
+    @app.route('/api/spec')
+    def spec():
+        return send_from_directory(app.static_folder, 'openapi.json', max_age=3600)
 
 
 def create_app():
@@ -35,20 +110,27 @@ def create_app():
         Configured Flask application
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Load configuration
     app.config.from_object(get_config())
     
     # Initialize extensions
     init_db(app)
-    jwt = JWTManager(app)
-    CORS(app, origins=app.config['CORS_ORIGINS'])
+    jwt = CachingJWTManager(app)
+    init_auth(app)
+    init_cors(app)
     
     # Initialize rate limiting (optional, controlled by env var)
     init_limiter(app)
     
-    # Setup Swagger documentation
-    setup_swagger(app)
+    # Setup Swagger documentation; production serves the pre-rendered spec
+    # (imported here to keep apispec off the import path)
+    if app.debug or app.testing:
+        from config import setup_swagger
+        setup_swagger(app)
+    else:
+        register_static_spec(app)
     
     # Register blueprints
     app.register_blueprint(info_bp)        # / and /health
@@ -56,101 +138,124 @@ def create_app():
     app.register_blueprint(users_bp)       # /users/*
     app.register_blueprint(posts_bp)       # /posts/*
     
-    # JWT error handlers
-    @jwt.expired_token_loader
-    def expired_token_callback(jwt_header, jwt_payload):
-        return create_error_response("Token has expired", 401)
-    
-    @jwt.invalid_token_loader
-    def invalid_token_callback(error):
-        return create_error_response("Invalid token", 401)
+    # Build the URL matcher now rather than on the first request
+    # (with preload_app this happens once in the gunicorn master)
+    app.url_map.update()
     
-    @jwt.unauthorized_loader
-    def unauthorized_callback(error):
-        return create_error_response("Authorization required", 401)
+    # JWT error handlers
+    jwt.expired_token_loader(expired_token_callback)
+    jwt.invalid_token_loader(invalid_token_callback)
+    jwt.unauthorized_loader(unauthorized_callback)
     
     # Global error handlers
-    @app.errorhandler(404)
-    def not_found(error):
-        return create_error_response("Resource not found", 404)
+    app.register_error_handler(404, not_found)
+    app.register_error_handler(405, method_not_allowed)
+    app.register_error_handler(500, internal_error)
     
-    @app.errorhandler(405)
-    def method_not_allowed(error):
-        return create_error_response("Method not allowed", 405)
-    
-    @app.errorhandler(500)
-    def internal_error(error):
-        return create_error_response("Internal server error", 500)
+    # Auth errors raised by the middleware decorators
+    app.register_error_handler(AuthenticationError, authentication_error)
+    app.register_error_handler(AuthorizationError, authorization_error)
     
     # Rate limit error handler
-    @app.errorhandler(429)
-    def ratelimit_handler(e):
-        return create_error_response(
-            f"Rate limit exceeded. {e.description}",
-            429
-        )
+    app.register_error_handler(429, ratelimit_handler)
     
     return app
 
 
 def print_startup_info(app):
-    """Print startup information"""
+    """Print startup information (single write to stdout)"""
     port = os.environ.get('PORT', 5000)
-    print("\n" + "="*70)
-    print(" Blog API with Authentication (Week 4)")
-    print("="*70)
-    print(f" Database: {app.config['SQLALCHEMY_DATABASE_URI']}")
-    print(f" Server: http://localhost:{port}")
-    print(f" API Docs: http://localhost:{port}/api/docs")
-    print(f" Environment: {os.environ.get('FLASK_ENV', 'development')}")
     
     # Rate limiting status
     if app.config.get('RATELIMIT_ENABLED'):
-        print(f" Rate Limiting: ENABLED ({app.config.get('RATELIMIT_DEFAULT')})")
+        rate_limiting = f"ENABLED ({app.config.get('RATELIMIT_DEFAULT')})"
     else:
-        print(f" Rate Limiting: DISABLED")
-    
-    print("\n Features:")
-    print("  • JWT Authentication (access + refresh tokens)")
-    print("  • Role-based Access Control (user, admin)")
-    print("  • Pydantic Schema Validation")
-    print("  • Database Constraints")
-    print("  • Password Hashing (bcrypt)")
-    print("  • Ownership-based Authorization")
-    print("  • Swagger/OpenAPI Documentation")
-    print("  • Rate Limiting (configurable)")
-    print("\n Clean Architecture:")
-    print("  • models/ - SQLAlchemy ORM with constraints")
-    print("  • schemas/ - Pydantic validation")
-    print("  • services/ - Business logic")
-    print("  • middleware/ - JWT decorators")
-    print("  • routes/ - Flask blueprints")
-    print("  • utils/ - Helper functions")
-    print("\n Security:")
-    print("  • Passwords never stored in plain text")
-    print("  • SQL injection prevention (SQLAlchemy)")
-    print("  • Input validation (Pydantic)")
-    print("  • CORS configuration")
-    print("  • Token expiration")
-    print("  • Rate limiting (when enabled)")
-    print("\n Quick Start:")
-    print(f"  1. Open http://localhost:{port}/api/docs in browser")
-    print("  2. Try the /auth/register endpoint")
-    print("  3. Copy the access_token from response")
-    print("  4. Click 'Authorize' button and paste token")
-    print("  5. Try protected endpoints!")
-    print("="*70 + "\n")
+        rate_limiting = "DISABLED"
+    
+    rule = "=" * 70
+    sys.stdout.write(f"""
+{rule}
+ Blog API with Authentication (Week 4)
+{rule}
+ Database: {app.config['SQLALCHEMY_DATABASE_URI']}
+ Server: http://localhost:{port}
+ API Docs: http://localhost:{port}/api/docs
+ Environment: {os.environ.get('FLASK_ENV', 'development')}
+ Rate Limiting: {rate_limiting}
+
+ Features:
+  • JWT Authentication (access + refresh tokens)
+  • Role-based Access Control (user, admin)
+  • Pydantic Schema Validation
+  • Database Constraints
+  • Password Hashing (bcrypt)
+  • Ownership-based Authorization
+  • Swagger/OpenAPI Documentation
+  • Rate Limiting (configurable)
+
+ Clean Architecture:
+  • models/ - SQLAlchemy ORM with constraints
+  • schemas/ - Pydantic validation
+  • services/ - Business logic
+  • middleware/ - JWT decorators
+  • routes/ - Flask blueprints
+  • utils/ - Helper functions
+
+ Security:
+  • Passwords never stored in plain text
+  • SQL injection prevention (SQLAlchemy)
+  • Input validation (Pydantic)
+  • CORS configuration
+  • Token expiration
+  • Rate limiting (when enabled)
+
+ Quick Start:
+  1. Open http://localhost:{port}/api/docs in browser
+  2. Try the /auth/register endpoint
+  3. Copy the access_token from response
+  4. Click 'Authorize' button and paste token
+  5. Try protected endpoints!
+{rule}
+
+""")
+    sys.stdout.flush()
+
+
+def run_production_server(port: int):
+    """
+    Replace the current process with a gunicorn server
+    
+    Serves the same factory-built app (via wsgi.py) with multiple
+    keep-alive capable workers instead of Werkzeug's dev server.
+    Worker settings live in gunicorn.conf.py.
+    
+    Args:
+        port: Port to bind to
+    """
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py')
+    
+    os.execvp("gunicorn", [
+        "gunicorn",
+        "-c", config_path,
+        "-b", f"0.0.0.0:{port}",
+    ])
 
 
 if __name__ == '__main__':
+    port = int(os.environ.get('PORT', 5000))
+    
+    # Production: hand off to gunicorn (builds its own app from wsgi.py)
+    if os.environ.get('FLASK_ENV') == 'production':
+        run_production_server(port)
+    
     # Create application
     app = create_app()
     
-    # Print startup info
-    print_startup_info(app)
+    # Print startup info (development only)
+    if app.debug:
+        print_startup_info(app)
     
-    # Run application
-    port = int(os.environ.get('PORT', 5000))
+    # Run development server
     debug = app.config['DEBUG']
     
     app.run(host='0.0.0.0', port=port, debug=debug)
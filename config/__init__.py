@@ -1,8 +1,14 @@
-"""Configuration package exports."""
+"""Configuration package exports.
+
+Swagger and rate limiting pull in heavy third-party packages (apispec,
+flask_limiter), so they are imported on first attribute access (PEP 562).
+"""
+
+from importlib import import_module
 
 from .settings import get_config
-from .swagger import setup_swagger
-from .rate_limit import get_limiter, init_limiter
+from .jwt_manager import CachingJWTManager
+from .cors import init_cors
 from .exceptions import (
     BlogAPIError,
     ValidationError,
@@ -15,11 +21,20 @@ from .exceptions import (
     DatabaseError,
 )
 
+# Attribute name -> submodule that defines it
+_LAZY_ATTRS = {
+    "setup_swagger": ".swagger",
+    "init_limiter": ".rate_limit",
+    "get_limiter": ".rate_limit",
+}
+
 __all__ = [
     "get_config",
     "setup_swagger",
     "init_limiter",
     "get_limiter",
+    "CachingJWTManager",
+    "init_cors",
     "BlogAPIError",
     "ValidationError",
     "AuthenticationError",
@@ -30,3 +45,14 @@ __all__ = [
     "InvalidTokenError",
     "DatabaseError",
 ]
+
+
+def __getattr__(name):
+    """Import lazily exported attributes on first access"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,40 @@
+"""
+CORS Module
+
+Adds CORS headers for a fixed origin whitelist.
+Origins are configured via the CORS_ORIGINS environment variable.
+"""
+
+from flask import request
+
+ALLOWED_HEADERS = 'Authorization, Content-Type'
+ALLOWED_METHODS = 'GET, POST, PUT, DELETE, OPTIONS'
+
+
+def init_cors(app):
+    """
+    Register an after_request hook that sets CORS headers
+    
+    The origin check is a single frozenset lookup per response.
+    
+    Args:
+        app: Flask application instance
+    """
+    allowed = frozenset(app.config.get('CORS_ORIGINS', ('*',)))
+    allow_all = '*' in allowed
+    
+    @app.after_request
+    def add_cors_headers(response):
+        origin = request.headers.get('Origin')
+        if origin is None or not (allow_all or origin in allowed):
+            return response
+        
+        if allow_all:
+            response.headers['Access-Control-Allow-Origin'] = '*'
+        else:
+            response.headers['Access-Control-Allow-Origin'] = origin
+            response.vary.add('Origin')
+        response.headers['Access-Control-Allow-Headers'] = ALLOWED_HEADERS
+        response.headers['Access-Control-Allow-Methods'] = ALLOWED_METHODS
+        
+        return response
@@ -7,11 +7,13 @@ Provides clear error types for different failure scenarios.
 
 class BlogAPIError(Exception):
     """Base exception for all blog API errors"""
-    pass
+    __slots__ = ('message',)
 
 
 class ValidationError(BlogAPIError):
     """Raised when input validation fails"""
+    __slots__ = ('field',)
+
     def __init__(self, message: str, field: str = None):
         self.message = message
         self.field = field
@@ -20,6 +22,8 @@ class ValidationError(BlogAPIError):
 
 class AuthenticationError(BlogAPIError):
     """Raised when authentication fails"""
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed"):
         self.message = message
         super().__init__(self.message)
@@ -27,6 +31,8 @@ class AuthenticationError(BlogAPIError):
 
 class AuthorizationError(BlogAPIError):
     """Raised when user lacks permission"""
+    __slots__ = ()
+
     def __init__(self, message: str = "You don't have permission to perform this action"):
         self.message = message
         super().__init__(self.message)
@@ -34,22 +40,42 @@ class AuthorizationError(BlogAPIError):
 
 class UserNotFoundError(BlogAPIError):
     """Raised when a user doesn't exist"""
+    __slots__ = ('user_id',)
+
     def __init__(self, user_id: int = None):
         self.user_id = user_id
-        self.message = f"User with ID {user_id} not found" if user_id else "User not found"
-        super().__init__(self.message)
+        super().__init__(user_id)
+
+    @property
+    def message(self) -> str:
+        # Formatted on access, so handlers that only map to a 404 never pay for it
+        return f"User with ID {self.user_id} not found" if self.user_id else "User not found"
+
+    def __str__(self):
+        return self.message
 
 
 class PostNotFoundError(BlogAPIError):
     """Raised when a post doesn't exist"""
+    __slots__ = ('post_id',)
+
     def __init__(self, post_id: int = None):
         self.post_id = post_id
-        self.message = f"Post with ID {post_id} not found" if post_id else "Post not found"
-        super().__init__(self.message)
+        super().__init__(post_id)
+
+    @property
+    def message(self) -> str:
+        # Formatted on access, so handlers that only map to a 404 never pay for it
+        return f"Post with ID {self.post_id} not found" if self.post_id else "Post not found"
+
+    def __str__(self):
+        return self.message
 
 
 class DuplicateUserError(BlogAPIError):
     """Raised when attempting to create duplicate user"""
+    __slots__ = ('field', 'value')
+
     def __init__(self, field: str, value: str):
         self.field = field
         self.value = value
@@ -59,6 +85,8 @@ class DuplicateUserError(BlogAPIError):
 
 class InvalidTokenError(BlogAPIError):
     """Raised when JWT token is invalid"""
+    __slots__ = ()
+
     def __init__(self, message: str = "Invalid or expired token"):
         self.message = message
         super().__init__(self.message)
@@ -66,6 +94,8 @@ class InvalidTokenError(BlogAPIError):
 
 class DatabaseError(BlogAPIError):
     """Raised when a database operation fails"""
+    __slots__ = ()
+
     def __init__(self, message: str = "Database operation failed"):
         self.message = message
         super().__init__(self.message)
@@ -0,0 +1,81 @@
+"""
+JWT Manager Module
+
+Provides a JWTManager that caches successfully decoded tokens so repeated
+requests with the same access token skip signature verification.
+
+With JWT_ALGORITHM=EdDSA the Ed25519 key files are parsed once at startup
+and the key objects are handed to PyJWT, so no PEM is re-parsed per token.
+"""
+
+from flask_jwt_extended import JWTManager
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager backed by a TokenCache of decoded tokens
+    
+    Sized by JWT_CACHE_SIZE (0 disables) with entries kept for at most
+    JWT_CACHE_TTL seconds or until the token's `exp`, whichever is first.
+    Failed decodes are never cached.
+    """
+    
+    def __init__(self, app=None, add_context_processor: bool = False):
+        self.token_cache = None
+        super().__init__(app, add_context_processor)
+    
+    def init_app(self, app, add_context_processor: bool = False):
+        super().init_app(app, add_context_processor)
+        
+        if app.config.get('JWT_ALGORITHM') == 'EdDSA':
+            _load_ed25519_keys(app)
+        
+        # Imported here: middleware depends on config, not the other way round
+        from middleware.token_cache import TokenCache
+        
+        self.token_cache = TokenCache(
+            ttl_seconds=app.config.get('JWT_CACHE_TTL', 60),
+            max_size=app.config.get('JWT_CACHE_SIZE', 8192)
+        )
+    
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # Only the plain verification path is cacheable
+        cache = self.token_cache
+        if csrf_value or allow_expired or cache is None or not cache.max_size:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        
+        claims = cache.get(encoded_token)
+        if claims is not None:
+            return claims
+        
+        # Raises on invalid/expired tokens, so failures never reach the cache
+        claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        cache.set(encoded_token, claims)
+        return claims
+
+
+def _load_ed25519_keys(app):
+    """
+    Parse the Ed25519 PEM key files into key objects once
+    
+    Args:
+        app: Flask application instance
+        
+    Raises:
+        ValueError: If a key file is not configured
+    """
+    # Optional dependency: only needed when signing with EdDSA
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key,
+        load_pem_public_key
+    )
+    
+    private_path = app.config.get('JWT_PRIVATE_KEY_FILE')
+    public_path = app.config.get('JWT_PUBLIC_KEY_FILE')
+    if not private_path or not public_path:
+        raise ValueError("JWT_PRIVATE_KEY_FILE and JWT_PUBLIC_KEY_FILE must be set for EdDSA")
+    
+    with open(private_path, 'rb') as f:
+        app.config['JWT_PRIVATE_KEY'] = load_pem_private_key(f.read(), password=None)
+    with open(public_path, 'rb') as f:
+        app.config['JWT_PUBLIC_KEY'] = load_pem_public_key(f.read())
@@ -5,9 +5,6 @@ Provides rate limiting functionality for the API.
 Can be enabled/disabled via RATE_LIMIT_ENABLED environment variable.
 """
 
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
-
 # Global limiter instance
 limiter = None
 
@@ -28,11 +25,17 @@ def init_limiter(app):
         print("ℹ️  Rate limiting: DISABLED")
         return None
     
+    # Imported here so apps with rate limiting disabled never load flask_limiter
+    from flask_limiter import Limiter
+    from flask_limiter.util import get_remote_address
+    
+    storage_uri = app.config.get('RATELIMIT_STORAGE_URI')
+    
     limiter = Limiter(
         app=app,
         key_func=get_remote_address,
-        storage_uri=app.config.get('RATELIMIT_STORAGE_URI'),
-        storage_options={},
+        storage_uri=storage_uri,
+        storage_options=_storage_options(app, storage_uri),
         strategy=app.config.get('RATELIMIT_STRATEGY'),
         default_limits=[app.config.get('RATELIMIT_DEFAULT')],
         headers_enabled=app.config.get('RATELIMIT_HEADERS_ENABLED', True)
@@ -43,6 +46,33 @@ def init_limiter(app):
     return limiter
 
 
+def _storage_options(app, storage_uri: str) -> dict:
+    """
+    Build limiter storage options
+    
+    For Redis, all limiter checks in a worker share one blocking
+    connection pool instead of opening connections on demand.
+    
+    Args:
+        app: Flask application instance
+        storage_uri: Limiter storage URI
+        
+    Returns:
+        Options dict passed to the storage backend
+    """
+    if not storage_uri.startswith(('redis://', 'rediss://')):
+        return {}
+    
+    import redis
+    
+    return {
+        'connection_pool': redis.BlockingConnectionPool.from_url(
+            storage_uri,
+            max_connections=app.config.get('RATELIMIT_REDIS_MAX_CONNECTIONS', 64)
+        )
+    }
+
+
 def get_limiter():
     """
     Get the global limiter instance
@@ -6,15 +6,22 @@ Provides different configurations for development, testing, and production.
 
 import os
 import re
+from functools import lru_cache
 from datetime import timedelta
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Snapshot of the environment (after .env) used for all class attributes below
+_ENV = dict(os.environ)
+
 # Keep relative paths anchored at the project root after moving into config/.
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
+_SQLITE_PREFIX = "sqlite:///"
+_WIN_DRIVE_RE = re.compile(r"^[A-Za-z]:[\\/]")
+
 
 def _normalize_database_url(database_url: str) -> str:
     """
@@ -23,57 +30,107 @@ def _normalize_database_url(database_url: str) -> str:
     Flask treats relative sqlite URLs as relative to app.instance_path, which can
     be unwritable in some environments. This keeps sqlite DB files in the project.
     """
-    if not database_url.startswith("sqlite:///"):
+    if not database_url.startswith(_SQLITE_PREFIX):
         return database_url
 
-    sqlite_target = database_url.replace("sqlite:///", "", 1)
+    sqlite_target = database_url[len(_SQLITE_PREFIX):]
     if sqlite_target == ":memory:":
         return database_url
 
     # Already absolute: unix-like path (/...), windows drive (C:/...), or URI path.
-    if sqlite_target.startswith("/") or re.match(r"^[A-Za-z]:[\\/]", sqlite_target):
+    if sqlite_target.startswith("/") or _WIN_DRIVE_RE.match(sqlite_target):
         return database_url
 
     absolute_path = os.path.abspath(os.path.join(BASE_DIR, sqlite_target))
     return f"sqlite:///{absolute_path.replace(os.sep, '/')}"
 
 
+def _engine_options(database_url: str) -> dict:
+    """
+    Build SQLAlchemy engine options sized for multi-worker, multi-thread load.
+
+    In-memory SQLite uses a single static connection, so pool sizing does
+    not apply there.
+    """
+    # Compiled-statement cache (SQLAlchemy default 500) so hot queries are
+    # compiled once per process
+    query_cache = {'query_cache_size': int(_ENV.get('DB_QUERY_CACHE_SIZE', 1200))}
+    if database_url.startswith("sqlite://") and database_url.endswith(":memory:"):
+        return query_cache
+
+    options = {
+        **query_cache,
+        'pool_size': int(_ENV.get('DB_POOL_SIZE', 20)),
+        'max_overflow': int(_ENV.get('DB_MAX_OVERFLOW', 40)),
+        'pool_recycle': 1800,  # Recycle before server-side idle timeouts
+        'pool_pre_ping': True,  # Transparently replace dropped connections
+        'pool_use_lifo': True,  # Keep a small hot set of connections warm
+    }
+    statement_timeout = int(_ENV.get('DB_STATEMENT_TIMEOUT_MS', 0))
+    if database_url.startswith("postgres") and statement_timeout:
+        # Opt-in cap on runaway queries; migrations reset it (see migrations/env.py)
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    elif database_url.startswith("sqlite"):
+        # Pooled connections move between threads; wait on locks instead of failing
+        options['connect_args'] = {'check_same_thread': False, 'timeout': 30}
+    return options
+
+
 class Config:
     """Base configuration"""
     
     # Flask
-    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+    SECRET_KEY = _ENV.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     DEBUG = False
     TESTING = False
+    SEND_FILE_MAX_AGE_DEFAULT = 31536000  # 1 year for static files
     
     # Database
     SQLALCHEMY_DATABASE_URI = _normalize_database_url(
-        os.environ.get('DATABASE_URL', 'sqlite:///instance/blog.db')
+        _ENV.get('DATABASE_URL', 'sqlite:///instance/blog.db')
     )
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
+    SQLALCHEMY_RAISE_ON_LAZY_LOAD = False  # Raise on unplanned lazy loads (N+1 guard)
+    # db.create_all() on startup (creates only missing tables). Stays on until
+    # a real initial-schema migration exists; the current base revision
+    # doesn't build the tables, so `flask db upgrade` alone can't either.
+    AUTO_CREATE_ALL = _ENV.get('FLASK_AUTO_CREATE_ALL', '1').lower() in ('1', 'true')
     
     # JWT
-    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production')
-    JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=int(os.environ.get('JWT_ACCESS_TOKEN_EXPIRES', 900)))  # 15 min
-    JWT_REFRESH_TOKEN_EXPIRES = timedelta(seconds=int(os.environ.get('JWT_REFRESH_TOKEN_EXPIRES', 604800)))  # 7 days
+    JWT_SECRET_KEY = _ENV.get('JWT_SECRET_KEY', 'jwt-secret-key-change-in-production')
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=int(_ENV.get('JWT_ACCESS_TOKEN_EXPIRES', 900)))  # 15 min
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(seconds=int(_ENV.get('JWT_REFRESH_TOKEN_EXPIRES', 604800)))  # 7 days
+    JWT_ALGORITHM = _ENV.get('JWT_ALGORITHM', 'HS256')  # HS256 or EdDSA
+    JWT_DECODE_ALGORITHMS = [JWT_ALGORITHM]  # Only accept the algorithm we sign with
+    JWT_PRIVATE_KEY_FILE = _ENV.get('JWT_PRIVATE_KEY_FILE')  # Ed25519 PEM (EdDSA only)
+    JWT_PUBLIC_KEY_FILE = _ENV.get('JWT_PUBLIC_KEY_FILE')  # Ed25519 PEM (EdDSA only)
     JWT_TOKEN_LOCATION = ['headers']
     JWT_HEADER_NAME = 'Authorization'
     JWT_HEADER_TYPE = 'Bearer'
+    JWT_CACHE_SIZE = int(_ENV.get('JWT_CACHE_SIZE', 8192))  # Decoded tokens kept in memory (0 disables)
+    JWT_CACHE_TTL = int(_ENV.get('JWT_CACHE_TTL', 60))  # Max seconds a decoded token stays cached
     
     # Security
-    BCRYPT_LOG_ROUNDS = int(os.environ.get('BCRYPT_LOG_ROUNDS', 12))
+    BCRYPT_LOG_ROUNDS = int(_ENV.get('BCRYPT_LOG_ROUNDS', 12))
     
     # CORS
-    CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
+    CORS_ORIGINS = frozenset(
+        origin.strip() for origin in _ENV.get('CORS_ORIGINS', '*').split(',')
+    )
     
     # Rate Limiting
-    RATELIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'False').lower() == 'true'
-    RATELIMIT_STORAGE_URI = "memory://"  # Use memory for simple apps, Redis for production
-    RATELIMIT_STRATEGY = "fixed-window"
+    RATELIMIT_ENABLED = _ENV.get('RATE_LIMIT_ENABLED', 'False').lower() == 'true'
+    RATELIMIT_STORAGE_URI = _ENV.get('RATELIMIT_STORAGE_URI', 'memory://')  # Set a redis:// URI to share across workers
+    RATELIMIT_STRATEGY = _ENV.get('RATELIMIT_STRATEGY', 'fixed-window')  # One pipelined INCR + EXPIRE per hit on Redis
+    RATELIMIT_REDIS_MAX_CONNECTIONS = int(_ENV.get('RATELIMIT_REDIS_MAX_CONNECTIONS', 64))
     RATELIMIT_DEFAULT = "100 per hour"  # Default limit for all routes
     RATELIMIT_HEADERS_ENABLED = True  # Include rate limit info in headers
     
+    # API docs (Swagger UI + /api/spec in debug/testing)
+    ENABLE_SWAGGER = _ENV.get('ENABLE_SWAGGER', 'True').lower() == 'true'
+    
     # Pagination
     DEFAULT_PAGE_SIZE = 10
     MAX_PAGE_SIZE = 100
@@ -82,17 +139,22 @@ class Config:
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
-    SQLALCHEMY_ECHO = os.environ.get('SQL_ECHO', 'False') == 'True'
+    SQLALCHEMY_ECHO = _ENV.get('SQL_ECHO', 'False') == 'True'
+    SQLALCHEMY_RAISE_ON_LAZY_LOAD = True
 
 
 class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'  # In-memory database for tests
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options(SQLALCHEMY_DATABASE_URI)
+    SQLALCHEMY_RAISE_ON_LAZY_LOAD = True
     BCRYPT_LOG_ROUNDS = 4  # Faster for tests
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=1)
     RATELIMIT_ENABLED = False  # Disable rate limiting in tests
+    OPENAPI_EAGER = False  # Build the docs spec only if a test requests it
+    AUTO_CREATE_ALL = False  # conftest creates the schema once per session
 
 
 class ProductionConfig(Config):
@@ -100,20 +162,25 @@ class ProductionConfig(Config):
     DEBUG = False
     SQLALCHEMY_ECHO = False
     # In production, ensure all secrets come from environment
-    if not os.environ.get('JWT_SECRET_KEY'):
+    if Config.JWT_ALGORITHM == 'HS256' and not _ENV.get('JWT_SECRET_KEY'):
         raise ValueError("JWT_SECRET_KEY must be set in production")
 
 
-# Configuration dictionary
-config = {
+# Configuration classes by FLASK_ENV
+_CONFIG = {
     'development': DevelopmentConfig,
     'testing': TestingConfig,
-    'production': ProductionConfig,
-    'default': DevelopmentConfig
+    'production': ProductionConfig
 }
 
 
+@lru_cache(maxsize=1)
 def get_config():
-    """Get configuration based on FLASK_ENV"""
+    """
+    Get configuration based on FLASK_ENV
+
+    The class is resolved once per process; call `get_config.cache_clear()`
+    after changing FLASK_ENV to pick up a different configuration.
+    """
     env = os.environ.get('FLASK_ENV', 'development')
-    return config.get(env, config['default'])
+    return _CONFIG.get(env, DevelopmentConfig)
@@ -5,18 +5,28 @@ Generates OpenAPI 3.0 specification for the Blog API.
 Access documentation at /api/docs
 """
 
-from apispec import APISpec
-from flask import jsonify
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+import gzip
+import os
 
+from flask import Response, request
 
-def create_apispec():
-    """Create APISpec instance with metadata"""
-    return APISpec(
-        title="Blog API with Authentication",
-        version="1.0.0",
-        openapi_version="3.0.0",
-        info={
-            "description": """
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional for the docs
+    orjson = None
+    import json
+
+# Pre-rendered spec served in production (see export_spec)
+STATIC_SPEC_PATH = Path(__file__).resolve().parent.parent / 'static' / 'openapi.json'
+
+# Set once the Swagger UI URL has been logged in this process
+_BANNER_SHOWN = False
+
+# Markdown shown at the top of the Swagger UI
+_API_DESCRIPTION = """
 # Blog API Documentation
 
 A production-ready RESTful blog API featuring:
@@ -41,510 +51,577 @@ Most endpoints require authentication. To authenticate:
 
 - **User**: Can create, read, update, and delete their own posts
 - **Admin**: Can delete any post (in addition to user permissions)
-            """,
-            "contact": {
-                "name": "API Support",
-                "email": "support@blogapi.com"
+            """
+
+# Component schemas (name -> JSON schema)
+_SCHEMAS = {
+    # User schemas
+    "UserRegister": {
+        "type": "object",
+        "required": ["username", "email", "password"],
+        "properties": {
+            "username": {
+                "type": "string",
+                "minLength": 3,
+                "maxLength": 50,
+                "example": "john_doe"
             },
-            "license": {
-                "name": "MIT",
-                "url": "https://opensource.org/licenses/MIT"
+            "email": {
+                "type": "string",
+                "format": "email",
+                "example": "john@example.com"
+            },
+            "password": {
+                "type": "string",
+                "minLength": 8,
+                "example": "SecurePass123!",
+                "description": "Must contain uppercase, lowercase, number, and special character"
             }
-        },
-        servers=[
-            {"url": "http://localhost:5000", "description": "Development server"},
-            {"url": "http://localhost:5001", "description": "Alternative development server"}
-        ],
-    )
-
-
-def get_apispec_dict(app):
-    """
-    Generate complete OpenAPI specification dictionary
-    
-    Args:
-        app: Flask application instance
-        
-    Returns:
-        OpenAPI specification as dictionary
-    """
-    spec = create_apispec()
-    
-    # Security schemes
-    spec.components.security_scheme(
-        "BearerAuth",
-        {
-            "type": "http",
-            "scheme": "bearer",
-            "bearerFormat": "JWT",
-            "description": "Enter your JWT access token"
         }
-    )
-    
-    # Define schemas
-    _add_schemas(spec)
-    
-    # Define paths
-    _add_paths(spec)
-    
-    return spec.to_dict()
+    },
 
+    "UserLogin": {
+        "type": "object",
+        "required": ["username", "password"],
+        "properties": {
+            "username": {"type": "string", "example": "john_doe"},
+            "password": {"type": "string", "example": "SecurePass123!"}
+        }
+    },
 
-def _add_schemas(spec):
-    """Add schema definitions to spec"""
-    
-    # User schemas
-    spec.components.schema(
-        "UserRegister",
-        {
-            "type": "object",
-            "required": ["username", "email", "password"],
-            "properties": {
-                "username": {
-                    "type": "string",
-                    "minLength": 3,
-                    "maxLength": 50,
-                    "example": "john_doe"
-                },
-                "email": {
-                    "type": "string",
-                    "format": "email",
-                    "example": "john@example.com"
-                },
-                "password": {
-                    "type": "string",
-                    "minLength": 8,
-                    "example": "SecurePass123!",
-                    "description": "Must contain uppercase, lowercase, number, and special character"
-                }
-            }
+    "UserResponse": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "example": 1},
+            "username": {"type": "string", "example": "john_doe"},
+            "email": {"type": "string", "example": "john@example.com"},
+            "role": {"type": "string", "enum": ["user", "admin"], "example": "user"},
+            "is_active": {"type": "boolean", "example": True},
+            "created_at": {"type": "string", "format": "date-time"}
         }
-    )
-    
-    spec.components.schema(
-        "UserLogin",
-        {
-            "type": "object",
-            "required": ["username", "password"],
-            "properties": {
-                "username": {"type": "string", "example": "john_doe"},
-                "password": {"type": "string", "example": "SecurePass123!"}
-            }
+    },
+
+    "TokenResponse": {
+        "type": "object",
+        "properties": {
+            "access_token": {"type": "string"},
+            "refresh_token": {"type": "string"},
+            "token_type": {"type": "string", "example": "Bearer"},
+            "expires_in": {"type": "integer", "example": 900},
+            "user": {"$ref": "#/components/schemas/UserResponse"}
         }
-    )
-    
-    spec.components.schema(
-        "UserResponse",
-        {
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer", "example": 1},
-                "username": {"type": "string", "example": "john_doe"},
-                "email": {"type": "string", "example": "john@example.com"},
-                "role": {"type": "string", "enum": ["user", "admin"], "example": "user"},
-                "is_active": {"type": "boolean", "example": True},
-                "created_at": {"type": "string", "format": "date-time"}
+    },
+
+    # Post schemas
+    "PostCreate": {
+        "type": "object",
+        "required": ["title", "content"],
+        "properties": {
+            "title": {
+                "type": "string",
+                "minLength": 1,
+                "maxLength": 200,
+                "example": "My First Blog Post"
+            },
+            "content": {
+                "type": "string",
+                "minLength": 10,
+                "example": "This is the content of my blog post..."
             }
         }
-    )
-    
-    spec.components.schema(
-        "TokenResponse",
-        {
-            "type": "object",
-            "properties": {
-                "access_token": {"type": "string"},
-                "refresh_token": {"type": "string"},
-                "token_type": {"type": "string", "example": "Bearer"},
-                "expires_in": {"type": "integer", "example": 900},
-                "user": {"$ref": "#/components/schemas/UserResponse"}
+    },
+
+    "PostResponse": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "example": 1},
+            "title": {"type": "string", "example": "My First Blog Post"},
+            "content": {"type": "string", "example": "This is the content..."},
+            "created_at": {"type": "string", "format": "date-time"},
+            "updated_at": {"type": "string", "format": "date-time"},
+            "author": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "username": {"type": "string"},
+                    "role": {"type": "string"}
+                }
             }
         }
-    )
-    
-    # Post schemas
-    spec.components.schema(
-        "PostCreate",
-        {
-            "type": "object",
-            "required": ["title", "content"],
-            "properties": {
-                "title": {
-                    "type": "string",
-                    "minLength": 1,
-                    "maxLength": 200,
-                    "example": "My First Blog Post"
-                },
-                "content": {
-                    "type": "string",
-                    "minLength": 10,
-                    "example": "This is the content of my blog post..."
-                }
+    },
+
+    # Page of posts from page/per_page (OFFSET) paging
+    "PostPage": {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/PostResponse"}
+            },
+            "total": {"type": "integer"},
+            "page": {"type": "integer"},
+            "per_page": {"type": "integer"},
+            "pages": {"type": "integer"},
+            "next_after": {
+                "type": "string",
+                "nullable": True,
+                "description": "Cursor to continue with ?after= (null on the last page)",
+                "example": "2024-01-15T10:30:00,42"
             }
         }
-    )
-    
-    spec.components.schema(
-        "PostResponse",
-        {
-            "type": "object",
-            "properties": {
-                "id": {"type": "integer", "example": 1},
-                "title": {"type": "string", "example": "My First Blog Post"},
-                "content": {"type": "string", "example": "This is the content..."},
-                "created_at": {"type": "string", "format": "date-time"},
-                "updated_at": {"type": "string", "format": "date-time"},
-                "author": {
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "integer"},
-                        "username": {"type": "string"},
-                        "role": {"type": "string"}
-                    }
-                }
+    },
+
+    # Page of posts from ?after= (keyset) paging: no total/page/pages
+    "PostKeysetPage": {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/PostResponse"}
+            },
+            "per_page": {"type": "integer"},
+            "next_after": {
+                "type": "string",
+                "nullable": True,
+                "description": "Cursor for the next page (null on the last page)",
+                "example": "2024-01-15T10:30:00,42"
             }
         }
-    )
-    
+    },
+
     # Common schemas
-    spec.components.schema(
-        "Error",
-        {
-            "type": "object",
-            "properties": {
-                "success": {"type": "boolean", "example": False},
-                "error": {"type": "string", "example": "Error message"}
-            }
+    "Error": {
+        "type": "object",
+        "properties": {
+            "success": {"type": "boolean", "example": False},
+            "error": {"type": "string", "example": "Error message"}
         }
-    )
+    }
+}
 
 
-def _add_paths(spec):
-    """Add API paths to spec"""
-    
+# API paths (path -> operations)
+_PATHS = {
     # Auth endpoints
-    spec.path(
-        path="/auth/register",
-        operations={
-            "post": {
-                "tags": ["Authentication"],
-                "summary": "Register a new user",
-                "description": "Create a new user account and receive JWT tokens",
-                "requestBody": {
-                    "required": True,
+    "/auth/register": {
+        "post": {
+            "tags": ["Authentication"],
+            "summary": "Register a new user",
+            "description": "Create a new user account and receive JWT tokens",
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/UserRegister"}
+                    }
+                }
+            },
+            "responses": {
+                "201": {
+                    "description": "User created successfully",
                     "content": {
                         "application/json": {
-                            "schema": {"$ref": "#/components/schemas/UserRegister"}
-                        }
-                    }
-                },
-                "responses": {
-                    "201": {
-                        "description": "User created successfully",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "success": {"type": "boolean", "example": True},
-                                        "message": {"type": "string"},
-                                        "data": {"$ref": "#/components/schemas/TokenResponse"}
-                                    }
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "success": {"type": "boolean", "example": True},
+                                    "message": {"type": "string"},
+                                    "data": {"$ref": "#/components/schemas/TokenResponse"}
                                 }
                             }
                         }
-                    },
-                    "400": {
-                        "description": "Validation error or duplicate user",
-                        "content": {
-                            "application/json": {
-                                "schema": {"$ref": "#/components/schemas/Error"}
-                            }
+                    }
+                },
+                "400": {
+                    "description": "Validation error or duplicate user",
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Error"}
                         }
                     }
                 }
             }
         }
-    )
-    
-    spec.path(
-        path="/auth/login",
-        operations={
-            "post": {
-                "tags": ["Authentication"],
-                "summary": "Login user",
-                "description": "Authenticate and receive JWT tokens",
-                "requestBody": {
-                    "required": True,
+    },
+
+    "/auth/login": {
+        "post": {
+            "tags": ["Authentication"],
+            "summary": "Login user",
+            "description": "Authenticate and receive JWT tokens",
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/UserLogin"}
+                    }
+                }
+            },
+            "responses": {
+                "200": {
+                    "description": "Login successful",
                     "content": {
                         "application/json": {
-                            "schema": {"$ref": "#/components/schemas/UserLogin"}
-                        }
-                    }
-                },
-                "responses": {
-                    "200": {
-                        "description": "Login successful",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "success": {"type": "boolean", "example": True},
-                                        "data": {"$ref": "#/components/schemas/TokenResponse"}
-                                    }
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "success": {"type": "boolean", "example": True},
+                                    "data": {"$ref": "#/components/schemas/TokenResponse"}
                                 }
                             }
                         }
-                    },
-                    "401": {"description": "Invalid credentials"}
-                }
+                    }
+                },
+                "401": {"description": "Invalid credentials"}
             }
         }
-    )
-    
-    spec.path(
-        path="/auth/refresh",
-        operations={
-            "post": {
-                "tags": ["Authentication"],
-                "summary": "Refresh access token",
-                "description": "Get a new access token using refresh token",
-                "security": [{"BearerAuth": []}],
-                "responses": {
-                    "200": {
-                        "description": "New access token",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "success": {"type": "boolean"},
-                                        "data": {
-                                            "type": "object",
-                                            "properties": {
-                                                "access_token": {"type": "string"},
-                                                "token_type": {"type": "string"},
-                                                "expires_in": {"type": "integer"}
-                                            }
+    },
+
+    "/auth/refresh": {
+        "post": {
+            "tags": ["Authentication"],
+            "summary": "Refresh access token",
+            "description": "Get a new access token using refresh token",
+            "security": [{"BearerAuth": []}],
+            "responses": {
+                "200": {
+                    "description": "New access token",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "success": {"type": "boolean"},
+                                    "data": {
+                                        "type": "object",
+                                        "properties": {
+                                            "access_token": {"type": "string"},
+                                            "token_type": {"type": "string"},
+                                            "expires_in": {"type": "integer"}
                                         }
                                     }
                                 }
                             }
                         }
-                    },
-                    "401": {"description": "Invalid or expired refresh token"}
-                }
+                    }
+                },
+                "401": {"description": "Invalid or expired refresh token"}
             }
         }
-    )
-    
+    },
+
     # User endpoints
-    spec.path(
-        path="/users/me",
-        operations={
-            "get": {
-                "tags": ["Users"],
-                "summary": "Get current user profile",
-                "security": [{"BearerAuth": []}],
-                "responses": {
-                    "200": {
-                        "description": "User profile",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "success": {"type": "boolean"},
-                                        "data": {"$ref": "#/components/schemas/UserResponse"}
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "401": {"description": "Unauthorized"}
-                }
-            },
-            "put": {
-                "tags": ["Users"],
-                "summary": "Update current user profile",
-                "security": [{"BearerAuth": []}],
-                "requestBody": {
+    "/users/me": {
+        "get": {
+            "tags": ["Users"],
+            "summary": "Get current user profile",
+            "security": [{"BearerAuth": []}],
+            "responses": {
+                "200": {
+                    "description": "User profile",
                     "content": {
                         "application/json": {
                             "schema": {
                                 "type": "object",
                                 "properties": {
-                                    "email": {"type": "string", "format": "email"},
-                                    "password": {"type": "string", "minLength": 8}
+                                    "success": {"type": "boolean"},
+                                    "data": {"$ref": "#/components/schemas/UserResponse"}
                                 }
                             }
                         }
                     }
                 },
-                "responses": {
-                    "200": {"description": "Profile updated"},
-                    "400": {"description": "Validation error"},
-                    "401": {"description": "Unauthorized"}
-                }
+                "401": {"description": "Unauthorized"}
             }
-        }
-    )
-    
-    # Post endpoints
-    spec.path(
-        path="/posts",
-        operations={
-            "get": {
-                "tags": ["Posts"],
-                "summary": "List all posts (public)",
-                "parameters": [
-                    {
-                        "name": "page",
-                        "in": "query",
-                        "schema": {"type": "integer", "default": 1}
-                    },
-                    {
-                        "name": "per_page",
-                        "in": "query",
-                        "schema": {"type": "integer", "default": 10}
-                    }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Paginated list of posts",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "success": {"type": "boolean"},
-                                        "data": {
-                                            "type": "object",
-                                            "properties": {
-                                                "items": {
-                                                    "type": "array",
-                                                    "items": {"$ref": "#/components/schemas/PostResponse"}
-                                                },
-                                                "total": {"type": "integer"},
-                                                "page": {"type": "integer"},
-                                                "per_page": {"type": "integer"},
-                                                "pages": {"type": "integer"}
-                                            }
-                                        }
-                                    }
-                                }
+        },
+        "put": {
+            "tags": ["Users"],
+            "summary": "Update current user profile",
+            "security": [{"BearerAuth": []}],
+            "requestBody": {
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "email": {"type": "string", "format": "email"},
+                                "password": {"type": "string", "minLength": 8}
                             }
                         }
                     }
                 }
             },
-            "post": {
-                "tags": ["Posts"],
-                "summary": "Create a new post (authenticated)",
-                "security": [{"BearerAuth": []}],
-                "requestBody": {
-                    "required": True,
+            "responses": {
+                "200": {"description": "Profile updated"},
+                "400": {"description": "Validation error"},
+                "401": {"description": "Unauthorized"}
+            }
+        }
+    },
+
+    # Post endpoints
+    "/posts": {
+        "get": {
+            "tags": ["Posts"],
+            "summary": "List all posts (public)",
+            "parameters": [
+                {
+                    "name": "page",
+                    "in": "query",
+                    "schema": {"type": "integer", "default": 1}
+                },
+                {
+                    "name": "per_page",
+                    "in": "query",
+                    "schema": {"type": "integer", "default": 10, "maximum": 100}
+                },
+                {
+                    "name": "after",
+                    "in": "query",
+                    "description": "Keyset cursor (\"<created_at>,<id>\") from a previous "
+                                   "response's next_after; replaces page for deep paging",
+                    "schema": {"type": "string", "example": "2024-01-15T10:30:00,42"}
+                }
+            ],
+            "responses": {
+                "200": {
+                    "description": "Paginated list of posts (PostKeysetPage when `after` is given)",
                     "content": {
                         "application/json": {
-                            "schema": {"$ref": "#/components/schemas/PostCreate"}
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "success": {"type": "boolean"},
+                                    "data": {
+                                        "oneOf": [
+                                            {"$ref": "#/components/schemas/PostPage"},
+                                            {"$ref": "#/components/schemas/PostKeysetPage"}
+                                        ]
+                                    }
+                                }
+                            }
                         }
                     }
                 },
-                "responses": {
-                    "201": {"description": "Post created"},
-                    "400": {"description": "Validation error"},
-                    "401": {"description": "Unauthorized"}
-                }
+                "400": {"description": "Invalid pagination parameters or malformed cursor"}
             }
-        }
-    )
-    
-    spec.path(
-        path="/posts/{post_id}",
-        operations={
-            "get": {
-                "tags": ["Posts"],
-                "summary": "Get specific post (public)",
-                "parameters": [
-                    {
-                        "name": "post_id",
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "integer"}
+        },
+        "post": {
+            "tags": ["Posts"],
+            "summary": "Create a new post (authenticated)",
+            "security": [{"BearerAuth": []}],
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/PostCreate"}
                     }
-                ],
-                "responses": {
-                    "200": {
-                        "description": "Post details",
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "success": {"type": "boolean"},
-                                        "data": {"$ref": "#/components/schemas/PostResponse"}
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "404": {"description": "Post not found"}
                 }
             },
-            "put": {
-                "tags": ["Posts"],
-                "summary": "Update post (owner only)",
-                "security": [{"BearerAuth": []}],
-                "parameters": [
-                    {
-                        "name": "post_id",
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "integer"}
-                    }
-                ],
-                "requestBody": {
+            "responses": {
+                "201": {"description": "Post created"},
+                "400": {"description": "Validation error"},
+                "401": {"description": "Unauthorized"}
+            }
+        }
+    },
+
+    "/posts/{post_id}": {
+        "get": {
+            "tags": ["Posts"],
+            "summary": "Get specific post (public)",
+            "parameters": [
+                {
+                    "name": "post_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"}
+                }
+            ],
+            "responses": {
+                "200": {
+                    "description": "Post details",
                     "content": {
                         "application/json": {
                             "schema": {
                                 "type": "object",
                                 "properties": {
-                                    "title": {"type": "string"},
-                                    "content": {"type": "string"}
+                                    "success": {"type": "boolean"},
+                                    "data": {"$ref": "#/components/schemas/PostResponse"}
                                 }
                             }
                         }
                     }
                 },
-                "responses": {
-                    "200": {"description": "Post updated"},
-                    "401": {"description": "Unauthorized"},
-                    "403": {"description": "Forbidden (not owner)"},
-                    "404": {"description": "Post not found"}
+                "404": {"description": "Post not found"}
+            }
+        },
+        "put": {
+            "tags": ["Posts"],
+            "summary": "Update post (owner only)",
+            "security": [{"BearerAuth": []}],
+            "parameters": [
+                {
+                    "name": "post_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"}
                 }
-            },
-            "delete": {
-                "tags": ["Posts"],
-                "summary": "Delete post (owner or admin)",
-                "security": [{"BearerAuth": []}],
-                "parameters": [
-                    {
-                        "name": "post_id",
-                        "in": "path",
-                        "required": True,
-                        "schema": {"type": "integer"}
+            ],
+            "requestBody": {
+                "content": {
+                    "application/json": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string"},
+                                "content": {"type": "string"}
+                            }
+                        }
                     }
-                ],
-                "responses": {
-                    "200": {"description": "Post deleted"},
-                    "401": {"description": "Unauthorized"},
-                    "403": {"description": "Forbidden (not owner or admin)"},
-                    "404": {"description": "Post not found"}
                 }
+            },
+            "responses": {
+                "200": {"description": "Post updated"},
+                "401": {"description": "Unauthorized"},
+                "403": {"description": "Forbidden (not owner)"},
+                "404": {"description": "Post not found"}
+            }
+        },
+        "delete": {
+            "tags": ["Posts"],
+            "summary": "Delete post (owner or admin)",
+            "security": [{"BearerAuth": []}],
+            "parameters": [
+                {
+                    "name": "post_id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "integer"}
+                }
+            ],
+            "responses": {
+                "200": {"description": "Post deleted"},
+                "401": {"description": "Unauthorized"},
+                "403": {"description": "Forbidden (not owner or admin)"},
+                "404": {"description": "Post not found"}
             }
         }
+    }
+}
+
+
+def create_apispec():
+    """Create APISpec instance with metadata"""
+    # Imported here so loading this module (or a docs-disabled app) skips apispec
+    from apispec import APISpec
+    
+    return APISpec(
+        title="Blog API with Authentication",
+        version="1.0.0",
+        openapi_version="3.0.0",
+        info={
+            "description": _API_DESCRIPTION,
+            "contact": {
+                "name": "API Support",
+                "email": "support@blogapi.com"
+            },
+            "license": {
+                "name": "MIT",
+                "url": "https://opensource.org/licenses/MIT"
+            }
+        },
+        servers=[
+            {"url": "http://localhost:5000", "description": "Development server"},
+            {"url": "http://localhost:5001", "description": "Alternative development server"}
+        ],
+    )
+
+
+def get_apispec_dict(app):
+    """
+    Generate complete OpenAPI specification dictionary
+    
+    The spec does not depend on app state, so it is built once per process
+    and shared by every app instance (tests, workers). Treat the returned
+    dictionary as read-only.
+    
+    Args:
+        app: Flask application instance
+        
+    Returns:
+        OpenAPI specification as dictionary
+    """
+    return _build_spec_dict()
+
+
+@lru_cache(maxsize=1)
+def _build_spec_dict():
+    """Build the OpenAPI specification (cached per process)"""
+    spec = create_apispec()
+    
+    # Security schemes
+    spec.components.security_scheme(
+        "BearerAuth",
+        {
+            "type": "http",
+            "scheme": "bearer",
+            "bearerFormat": "JWT",
+            "description": "Enter your JWT access token"
+        }
     )
+    
+    # Define schemas
+    _add_schemas(spec)
+    
+    # Define paths
+    _add_paths(spec)
+    
+    return spec.to_dict()
+
+
+def _add_schemas(spec):
+    """Add schema definitions to spec"""
+    for name, schema in _SCHEMAS.items():
+        spec.components.schema(name, schema)
+
+
+def _add_paths(spec):
+    """Add API paths to spec"""
+    for path, operations in _PATHS.items():
+        spec.path(path=path, operations=operations)
+
+
+def _dumps_spec(spec_dict, indent: bool = False) -> bytes:
+    """Encode the spec to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(spec_dict, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(spec_dict, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(spec_dict, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _get_spec_payload(app):
+    """
+    Return the encoded spec (plain and gzipped) and its ETag, building
+    them on first use
+    
+    Args:
+        app: Flask application instance
+        
+    Returns:
+        Tuple of (JSON bytes, gzipped JSON bytes, ETag)
+    """
+    payload = app.extensions.get('openapi_spec')
+    if payload is None:
+        body = _dumps_spec(get_apispec_dict(app))
+        payload = (
+            body,
+            gzip.compress(body, compresslevel=6),
+            blake2b(body, digest_size=16).hexdigest()
+        )
+        app.extensions['openapi_spec'] = payload
+    return payload
 
 
 def setup_swagger(app):
@@ -554,6 +631,9 @@ def setup_swagger(app):
     Args:
         app: Flask application instance
     """
+    if not app.config.get('ENABLE_SWAGGER', True):
+        return
+    
     from flask_swagger_ui import get_swaggerui_blueprint
     
     # Swagger UI configuration
@@ -577,12 +657,57 @@ def setup_swagger(app):
     
     app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
     
+    # Build and encode the spec once per app (OPENAPI_EAGER=False defers
+    # it to the first docs request)
+    if app.config.get('OPENAPI_EAGER', True):
+        _get_spec_payload(app)
+    
     # OpenAPI spec endpoint
     @app.route('/api/spec')
     def spec():
-        return jsonify(get_apispec_dict(app))
+        body, body_gz, etag = _get_spec_payload(app)
+        if request.accept_encodings['gzip']:
+            response = Response(body_gz, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+            etag = f"{etag}-gz"
+        else:
+            response = Response(body, mimetype='application/json')
+        response.vary.add('Accept-Encoding')
+        response.set_etag(etag)
+        # The spec only changes on deploy; let browsers/proxies revalidate hourly
+        response.cache_control.public = True
+        response.cache_control.max_age = 3600
+        return response.make_conditional(request)
+    
+    # Announce the docs URL once per process, not once per app
+    global _BANNER_SHOWN
+    if not _BANNER_SHOWN:
+        # Flask's app.logger emits INFO when debug is on (the dev server)
+        app.logger.info("Swagger UI: http://localhost:%s%s", os.environ.get('PORT', 5000), SWAGGER_URL)
+        _BANNER_SHOWN = True
+
+
+def export_spec(app, path=STATIC_SPEC_PATH):
+    """
+    Write the OpenAPI specification to a static JSON file
+    
+    Production skips setup_swagger and serves this file instead.
+    
+    Args:
+        app: Flask application instance
+        path: Destination file path
+        
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_dumps_spec(get_apispec_dict(app), indent=True))
+    return path
+
+
+if __name__ == '__main__':
+    # Usage: python -m config.swagger
+    from app import create_app
     
-    port = app.config.get('PORT', 5000)
-    if not hasattr(app, '_swagger_printed'):
-        print(f"Swagger UI: http://localhost:{port}{SWAGGER_URL}")
-        app._swagger_printed = True
+    print(f"Wrote {export_spec(create_app())}")
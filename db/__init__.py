@@ -1,5 +1,5 @@
 """Database package exports."""
 
-from .database import db, init_db, migrate
+from .database import db, init_db, init_db_engine, migrate, violated_unique_column
 
-__all__ = ["db", "init_db", "migrate"]
+__all__ = ["db", "init_db", "init_db_engine", "migrate", "violated_unique_column"]
@@ -4,14 +4,20 @@ Database configuration and initialization
 Handles SQLAlchemy setup and Flask-Migrate integration.
 """
 
+from flask import current_app, g
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
+import logging
 import os
 
 # Initialize extensions
 db = SQLAlchemy()
 migrate = Migrate()
 
+logger = logging.getLogger(__name__)
+
 
 def init_db(app):
     """
@@ -21,19 +27,129 @@ def init_db(app):
         app: Flask application instance
     """
     # Ensure SQLite parent directory exists before connecting.
-    db_uri = app.config.get("SQLALCHEMY_DATABASE_URI", "")
-    if db_uri.startswith("sqlite:///") and not db_uri.endswith(":memory:"):
-        db_path = db_uri.replace("sqlite:///", "", 1).split("?", 1)[0]
-        parent_dir = os.path.dirname(db_path)
-        if parent_dir:
-            os.makedirs(parent_dir, exist_ok=True)
+    _ensure_sqlite_dir(app.config.get("SQLALCHEMY_DATABASE_URI", ""))
 
     # Initialize SQLAlchemy with app
     db.init_app(app)
     
+    # Turn unplanned lazy loads into errors (enabled per config)
+    if not event.contains(db.session, 'do_orm_execute', _raise_on_lazy_load):
+        event.listen(db.session, 'do_orm_execute', _raise_on_lazy_load)
+    
+    # Report SQL issued while a response is being serialized (a lazy load
+    # the route should have eager-loaded)
+    if app.config.get('SQLALCHEMY_RAISE_ON_LAZY_LOAD', False):
+        with app.app_context():
+            if not event.contains(db.engine, 'before_cursor_execute', _warn_serialization_query):
+                event.listen(db.engine, 'before_cursor_execute', _warn_serialization_query)
+    
+    # File-based SQLite: WAL so readers don't block on the writer
+    db_uri = app.config.get("SQLALCHEMY_DATABASE_URI", "")
+    if db_uri.startswith("sqlite") and not db_uri.endswith(":memory:"):
+        with app.app_context():
+            event.listen(db.engine, "connect", _set_sqlite_pragmas)
+    
     # Initialize Flask-Migrate with app and db
     migrate.init_app(app, db)
     
-    # Create tables if they don't exist (for SQLite development)
+    # Create tables if they don't exist (on by default; tests create the
+    # schema in conftest instead)
+    if app.config.get("AUTO_CREATE_ALL", False):
+        with app.app_context():
+            db.create_all()
+
+
+def _ensure_sqlite_dir(db_uri: str):
+    """Create the parent directory of a file-based SQLite database if missing"""
+    prefix, sep, db_path = db_uri.partition("sqlite:///")
+    if prefix or not sep or db_path == ":memory:":
+        return
+    
+    parent_dir = os.path.dirname(db_path.split("?", 1)[0])
+    if parent_dir and not os.path.isdir(parent_dir):
+        os.makedirs(parent_dir, exist_ok=True)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply per-connection SQLite settings (WAL, relaxed fsync, in-memory temp tables)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=134217728")  # 128 MB
+    cursor.close()
+
+
+def init_db_engine(app):
+    """
+    Reset the connection pool in a freshly forked worker
+    
+    With gunicorn's preload_app the app (and its engine) is built once in
+    the master and shared copy-on-write. Pooled connections opened there
+    (e.g. by create_all) must not be reused across processes, so each
+    worker drops its inherited pool without closing the parent's sockets.
+    
+    Args:
+        app: Flask application instance
+    """
     with app.app_context():
-        db.create_all()
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def violated_unique_column(error) -> str:
+    """
+    Name the column behind a unique-constraint IntegrityError
+    
+    Reads the driver's structured diagnostics where available (psycopg
+    exposes the constraint name) and otherwise parses only the short
+    driver message (SQLite: "UNIQUE constraint failed: users.email"),
+    never the full statement text.
+    
+    Args:
+        error: sqlalchemy.exc.IntegrityError
+        
+    Returns:
+        Column name ('username', 'email', ...), or '' if unknown
+    """
+    orig = error.orig
+    diag = getattr(orig, 'diag', None)
+    constraint = getattr(diag, 'constraint_name', None)
+    if constraint:
+        # e.g. ix_users_email / users_email_key
+        for column in ('username', 'email'):
+            if column in constraint:
+                return column
+        return ''
+    
+    _, sep, detail = str(orig).partition('constraint failed: ')
+    if sep:
+        return detail.split(',', 1)[0].rsplit('.', 1)[-1].strip()
+    return ''
+
+
+def _raise_on_lazy_load(orm_execute_state):
+    """
+    Apply raiseload('*') to top-level ORM SELECTs
+    
+    With SQLALCHEMY_RAISE_ON_LAZY_LOAD enabled, any relationship that a
+    query did not load explicitly (e.g. via selectinload) raises instead of
+    silently issuing one query per row (N+1).
+    """
+    if not current_app.config.get('SQLALCHEMY_RAISE_ON_LAZY_LOAD', False):
+        return
+    
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload('*', sql_only=True)
+        )
+
+
+def _warn_serialization_query(conn, cursor, statement, parameters, context, executemany):
+    """Log any statement executed while g._in_serialization is set"""
+    if g and g.get('_in_serialization'):
+        logger.warning("Query executed during response serialization: %s", statement)
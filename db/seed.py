@@ -7,6 +7,7 @@ Creates:
 - 10 blog posts
 """
 
+from collections import Counter
 from pathlib import Path
 import sys
 
@@ -15,6 +16,8 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from sqlalchemy import delete, insert, text
+
 from app import create_app
 from db import db
 from models import User, Post
@@ -27,131 +30,137 @@ def seed_database():
     app = create_app()
     
     with app.app_context():
-        # Clear existing data
+        # Clear existing data (same transaction as the inserts below)
         print("Clearing existing data...")
-        Post.query.delete()
-        User.query.delete()
-        db.session.commit()
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(text(
+                f"TRUNCATE {Post.__tablename__}, {User.__tablename__} RESTART IDENTITY CASCADE"
+            ))
+        else:
+            db.session.execute(delete(Post).execution_options(synchronize_session=False))
+            db.session.execute(delete(User).execution_options(synchronize_session=False))
         
         print("Creating users...")
         
-        # Create admin user
-        admin = User(
-            username='admin',
-            email='admin@blog.com',
-            password_hash=hash_password('Admin123!'),
-            role='admin',
-            is_active=True
-        )
-        
-        # Create regular users
-        john = User(
-            username='john_doe',
-            email='john@example.com',
-            password_hash=hash_password('Password123!'),
-            role='user',
-            is_active=True
-        )
-        
-        jane = User(
-            username='jane_smith',
-            email='jane@example.com',
-            password_hash=hash_password('Password123!'),
-            role='user',
-            is_active=True
-        )
-        
-        bob = User(
-            username='bob_wilson',
-            email='bob@example.com',
-            password_hash=hash_password('Password123!'),
-            role='user',
-            is_active=True
-        )
-        
-        db.session.add_all([admin, john, jane, bob])
-        db.session.commit()
+        # bcrypt is deliberately slow: hash each distinct password once
+        admin_password_hash = hash_password('Admin123!')
+        user_password_hash = hash_password('Password123!')
+        
+        user_rows = [
+            # Admin user
+            {
+                'username': 'admin',
+                'email': 'admin@blog.com',
+                'password_hash': admin_password_hash,
+                'role': 'admin',
+                'is_active': True
+            },
+            # Regular users
+            {
+                'username': 'john_doe',
+                'email': 'john@example.com',
+                'password_hash': user_password_hash,
+                'role': 'user',
+                'is_active': True
+            },
+            {
+                'username': 'jane_smith',
+                'email': 'jane@example.com',
+                'password_hash': user_password_hash,
+                'role': 'user',
+                'is_active': True
+            },
+            {
+                'username': 'bob_wilson',
+                'email': 'bob@example.com',
+                'password_hash': user_password_hash,
+                'role': 'user',
+                'is_active': True
+            }
+        ]
+        
+        # One multi-row INSERT; RETURNING gives us the ids for the posts
+        user_ids = dict(db.session.execute(
+            insert(User).returning(User.username, User.id),
+            user_rows
+        ).all())
         
         print("Creating blog posts...")
         
-        # John's posts
-        post1 = Post(
-            title="Getting Started with Flask",
-            content="Flask is a lightweight WSGI web application framework. It is designed to make getting started quick and easy, with the ability to scale up to complex applications.",
-            author_id=john.id
-        )
-        
-        post2 = Post(
-            title="Introduction to SQLAlchemy",
-            content="SQLAlchemy is the Python SQL toolkit and Object Relational Mapper that gives application developers the full power and flexibility of SQL. Learn how to use it effectively.",
-            author_id=john.id
-        )
-        
-        post3 = Post(
-            title="REST API Best Practices",
-            content="Building a REST API requires careful planning. Here are some best practices to follow when designing your API endpoints, handling errors, and managing authentication.",
-            author_id=john.id
-        )
-        
-        # Jane's posts
-        post4 = Post(
-            title="Understanding JWT Authentication",
-            content="JSON Web Tokens (JWT) are an open standard for securely transmitting information between parties as a JSON object. This post explains how to implement JWT in your applications.",
-            author_id=jane.id
-        )
-        
-        post5 = Post(
-            title="Python Security Best Practices",
-            content="Security should be a top priority when building web applications. Learn about password hashing, SQL injection prevention, and other security measures.",
-            author_id=jane.id
-        )
-        
-        post6 = Post(
-            title="Database Design Fundamentals",
-            content="Good database design is crucial for application performance and scalability. This post covers normalization, indexing, and relationship design.",
-            author_id=jane.id
-        )
-        
-        post7 = Post(
-            title="Testing Flask Applications",
-            content="Testing is essential for maintaining code quality. Learn how to write unit tests and integration tests for your Flask applications using pytest.",
-            author_id=jane.id
-        )
-        
-        # Bob's posts
-        post8 = Post(
-            title="Deploying Flask to Production",
-            content="Moving from development to production requires careful consideration. This guide covers deployment strategies, environment configuration, and monitoring.",
-            author_id=bob.id
-        )
-        
-        post9 = Post(
-            title="API Documentation with OpenAPI",
-            content="Good API documentation is essential for developers. Learn how to document your API using OpenAPI (Swagger) specification.",
-            author_id=bob.id
-        )
-        
-        post10 = Post(
-            title="Microservices Architecture",
-            content="Microservices offer benefits for large-scale applications. This post explores when to use microservices and how to design them effectively.",
-            author_id=bob.id
-        )
-        
-        db.session.add_all([post1, post2, post3, post4, post5, post6, post7, post8, post9, post10])
+        post_rows = [
+            # John's posts
+            {
+                'title': "Getting Started with Flask",
+                'content': "Flask is a lightweight WSGI web application framework. It is designed to make getting started quick and easy, with the ability to scale up to complex applications.",
+                'author_id': user_ids['john_doe']
+            },
+            {
+                'title': "Introduction to SQLAlchemy",
+                'content': "SQLAlchemy is the Python SQL toolkit and Object Relational Mapper that gives application developers the full power and flexibility of SQL. Learn how to use it effectively.",
+                'author_id': user_ids['john_doe']
+            },
+            {
+                'title': "REST API Best Practices",
+                'content': "Building a REST API requires careful planning. Here are some best practices to follow when designing your API endpoints, handling errors, and managing authentication.",
+                'author_id': user_ids['john_doe']
+            },
+            # Jane's posts
+            {
+                'title': "Understanding JWT Authentication",
+                'content': "JSON Web Tokens (JWT) are an open standard for securely transmitting information between parties as a JSON object. This post explains how to implement JWT in your applications.",
+                'author_id': user_ids['jane_smith']
+            },
+            {
+                'title': "Python Security Best Practices",
+                'content': "Security should be a top priority when building web applications. Learn about password hashing, SQL injection prevention, and other security measures.",
+                'author_id': user_ids['jane_smith']
+            },
+            {
+                'title': "Database Design Fundamentals",
+                'content': "Good database design is crucial for application performance and scalability. This post covers normalization, indexing, and relationship design.",
+                'author_id': user_ids['jane_smith']
+            },
+            {
+                'title': "Testing Flask Applications",
+                'content': "Testing is essential for maintaining code quality. Learn how to write unit tests and integration tests for your Flask applications using pytest.",
+                'author_id': user_ids['jane_smith']
+            },
+            # Bob's posts
+            {
+                'title': "Deploying Flask to Production",
+                'content': "Moving from development to production requires careful consideration. This guide covers deployment strategies, environment configuration, and monitoring.",
+                'author_id': user_ids['bob_wilson']
+            },
+            {
+                'title': "API Documentation with OpenAPI",
+                'content': "Good API documentation is essential for developers. Learn how to document your API using OpenAPI (Swagger) specification.",
+                'author_id': user_ids['bob_wilson']
+            },
+            {
+                'title': "Microservices Architecture",
+                'content': "Microservices offer benefits for large-scale applications. This post explores when to use microservices and how to design them effectively.",
+                'author_id': user_ids['bob_wilson']
+            }
+        ]
+        
+        db.session.execute(insert(Post), post_rows)
         db.session.commit()
         
+        # Count from the rows we inserted instead of querying back
+        posts_per_author = Counter(row['author_id'] for row in post_rows)
+        
         print("\n" + "="*70)
         print("✅ Database seeded successfully!")
         print("="*70)
-        print(f"👥 Created {User.query.count()} users:")
+        print(f"👥 Created {len(user_rows)} users:")
         print(f"   • admin (admin@blog.com) - Admin role")
         print(f"   • john_doe (john@example.com) - User role")
         print(f"   • jane_smith (jane@example.com) - User role")
         print(f"   • bob_wilson (bob@example.com) - User role")
-        print(f"\n📝 Created {Post.query.count()} blog posts:")
-        print(f"   • John: {john.posts.count()} posts")
-        print(f"   • Jane: {jane.posts.count()} posts")
-        print(f"   • Bob: {bob.posts.count()} posts")
+        print(f"\n📝 Created {len(post_rows)} blog posts:")
+        print(f"   • John: {posts_per_author[user_ids['john_doe']]} posts")
+        print(f"   • Jane: {posts_per_author[user_ids['jane_smith']]} posts")
+        print(f"   • Bob: {posts_per_author[user_ids['bob_wilson']]} posts")
         print("\n🔑 Test credentials (all passwords: Password123!):")
         print("   • admin / Admin123!")
         print("   • john_doe / Password123!")
@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration
+
+The app is imported once in the master (preload_app) so config, compiled
+schemas and SQLAlchemy metadata are shared copy-on-write across workers.
+Per-process resources (database connections) are reset after fork.
+"""
+
+import os
+
+wsgi_app = 'wsgi:application'
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', (os.cpu_count() or 1) * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+keepalive = 5
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Give each worker its own database connection pool"""
+    from db import init_db_engine
+    from wsgi import application
+    
+    init_db_engine(application)
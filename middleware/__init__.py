@@ -2,6 +2,20 @@
 Middleware package - Custom middleware and decorators
 """
 
-from .auth import jwt_required, admin_required, get_current_user
+from .auth import (
+    jwt_required,
+    admin_required,
+    get_current_user,
+    get_current_identity,
+    identity_claims,
+    init_auth
+)
 
-__all__ = ['jwt_required', 'admin_required', 'get_current_user']
\ No newline at end of file
+__all__ = [
+    'jwt_required',
+    'admin_required',
+    'get_current_user',
+    'get_current_identity',
+    'identity_claims',
+    'init_auth'
+]
\ No newline at end of file
@@ -5,19 +5,61 @@ Provides:
 - @jwt_required decorator for protected routes
 - @admin_required decorator for admin-only routes
 - Helper functions to get current user
+
+@jwt_required only marks a view; the token is verified once by a
+before_request hook (see init_auth). The verified token and resolved user
+are memoized on flask.g for the duration of a request (cleared in
+teardown).
 """
 
 from functools import wraps
-from flask import request
+from flask import current_app, g, request
 from flask_jwt_extended import (
     verify_jwt_in_request,
     get_jwt_identity,
     get_jwt
 )
+from db import db
 from models import User
 from config import AuthenticationError, AuthorizationError, UserNotFoundError
 
 
+def init_auth(app):
+    """
+    Register request hooks for the auth helpers
+    
+    Args:
+        app: Flask application instance
+    """
+    app.before_request(_authenticate_request)
+    app.teardown_request(_clear_auth_state)
+
+
+def _authenticate_request():
+    """Verify the JWT before any view marked with @jwt_required runs"""
+    view = current_app.view_functions.get(request.endpoint)
+    if view is None or not getattr(view, '_jwt_required', False):
+        return
+    
+    try:
+        _verify_jwt()
+    except Exception:
+        raise AuthenticationError("Authentication required")
+
+
+def _clear_auth_state(exc=None):
+    """Drop the per-request auth memo (g can outlive a request in tests)"""
+    g.pop('_current_user', None)
+    g.pop('_jwt_verified', None)
+
+
+def _verify_jwt():
+    """Verify the request's JWT once per request"""
+    if not g.get('_jwt_verified'):
+        verify_jwt_in_request()
+        g._jwt_verified = True
+
+
 def get_current_user() -> User:
     """
     Get the current authenticated user from JWT
@@ -28,15 +70,18 @@ def get_current_user() -> User:
     Raises:
         AuthenticationError: If no valid JWT or user not found
     """
+    user = g.get('_current_user')
+    if user is not None:
+        return user
+    
     try:
-        # Verify JWT exists
-        verify_jwt_in_request()
+        # Verify JWT exists (skipped if a decorator already did)
+        _verify_jwt()
         
         # Get user ID from JWT
         user_id = int(get_jwt_identity())
         
         # Fetch user from database
-        from db import db
         user = db.session.get(User, user_id)
         
         if not user:
@@ -45,6 +90,7 @@ def get_current_user() -> User:
         if not user.is_active:
             raise AuthenticationError("Account is inactive")
         
+        g._current_user = user
         return user
         
     except Exception as e:
@@ -53,6 +99,46 @@ def get_current_user() -> User:
         raise AuthenticationError("Invalid or expired token")
 
 
+def identity_claims(user: User) -> dict:
+    """
+    Build the extra access-token claims read by get_current_identity()
+    
+    Args:
+        user: User the token is issued for
+        
+    Returns:
+        Dictionary of additional JWT claims
+    """
+    return {'role': user.role}
+
+
+def get_current_identity() -> tuple:
+    """
+    Get the current user's ID and role from the JWT, without a DB lookup
+    
+    The role comes from a claim set at token issue time (see
+    identity_claims) and the account's active status is not checked, so a
+    role change or deactivation only applies once the access token expires
+    (JWT_ACCESS_TOKEN_EXPIRES, 15 minutes by default); refresh re-checks
+    both. Use get_current_user() when that window is not acceptable.
+    
+    Returns:
+        Tuple of (user_id, role)
+        
+    Raises:
+        AuthenticationError: If no valid JWT
+    """
+    try:
+        _verify_jwt()
+        user_id = int(get_jwt_identity())
+        claims = get_jwt()
+    except Exception:
+        raise AuthenticationError("Invalid or expired token")
+    
+    # Tokens minted before the role claim existed get the least privilege
+    return user_id, claims.get('role', 'user')
+
+
 def get_current_user_id() -> int:
     """
     Get current user ID from JWT
@@ -64,7 +150,7 @@ def get_current_user_id() -> int:
         AuthenticationError: If no valid JWT
     """
     try:
-        verify_jwt_in_request()
+        _verify_jwt()
         return int(get_jwt_identity())
     except Exception:
         raise AuthenticationError("Invalid or expired token")
@@ -74,6 +160,10 @@ def jwt_required(fn):
     """
     Decorator to protect routes - requires valid JWT
     
+    Only marks the view; the before_request hook registered by init_auth
+    verifies the token before the view is dispatched, so the view must be
+    registered on an app initialised with init_auth.
+    
     Usage:
         @app.route('/protected')
         @jwt_required
@@ -81,15 +171,8 @@ def jwt_required(fn):
             user = get_current_user()
             return {'message': f'Hello {user.username}'}
     """
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        try:
-            verify_jwt_in_request()
-            return fn(*args, **kwargs)
-        except Exception as e:
-            raise AuthenticationError("Authentication required")
-    
-    return wrapper
+    fn._jwt_required = True
+    return fn
 
 
 def admin_required(fn):
@@ -107,22 +190,16 @@ def admin_required(fn):
     @wraps(fn)
     def wrapper(*args, **kwargs):
         try:
-            # Verify JWT
-            verify_jwt_in_request()
-            
-            # Get current user
+            # Verify JWT and load the user (rejects inactive accounts)
             user = get_current_user()
-            
-            # Check if admin
-            if not user.is_admin():
-                raise AuthorizationError("Admin access required")
-            
-            return fn(*args, **kwargs)
-            
-        except AuthorizationError:
-            raise
-        except Exception as e:
+        except UserNotFoundError:
             raise AuthenticationError("Authentication required")
+        
+        # Check if admin
+        if not user.is_admin():
+            raise AuthorizationError("Admin access required")
+        
+        return current_app.ensure_sync(fn)(*args, **kwargs)
     
     return wrapper
 
@@ -151,6 +228,6 @@ def optional_jwt(fn):
         except:
             pass  # Ignore JWT errors for optional routes
         
-        return fn(*args, **kwargs)
+        return current_app.ensure_sync(fn)(*args, **kwargs)
     
     return wrapper
@@ -0,0 +1,86 @@
+"""
+Token cache - LRU + TTL cache of verified JWT claims
+
+Lets repeated requests carrying the same access token skip signature
+verification and payload decoding. Only successful verifications are
+stored; the raw token is never kept, only its SHA-256 digest.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    """
+    Thread-safe LRU cache of decoded JWT claims with a TTL
+    
+    Each entry lives until the earlier of the token's own `exp` claim and
+    `ttl_seconds` after it was cached.
+    """
+    
+    def __init__(self, ttl_seconds: int = 60, max_size: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+    
+    def get(self, token: str):
+        """
+        Look up the claims cached for a token
+        
+        Args:
+            token: Encoded JWT
+            
+        Returns:
+            Copy of the cached claims, or None on a miss or expired entry
+        """
+        key = self._key(token)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return dict(claims)
+    
+    def set(self, token: str, claims: dict):
+        """
+        Cache the claims of a successfully verified token
+        
+        Tokens without an `exp` claim are not cached.
+        
+        Args:
+            token: Encoded JWT
+            claims: Decoded claims
+        """
+        if not self.max_size or 'exp' not in claims:
+            return
+        
+        key = self._key(token)
+        expires_at = min(claims['exp'], time.time() + self.ttl_seconds)
+        
+        with self._lock:
+            self._entries[key] = (expires_at, dict(claims))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,38 @@
+"""post listing indexes
+
+Revision ID: 3f9c2b7d41a8
+Revises: 66ca251a169a
+Create Date: 2026-10-15 10:12:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9c2b7d41a8'
+down_revision = '66ca251a169a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('idx_post_author_created', table_name='posts', if_exists=True)
+    op.create_index(
+        'idx_post_created_desc',
+        'posts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        if_not_exists=True
+    )
+    op.create_index(
+        'idx_post_author_created_desc',
+        'posts',
+        ['author_id', sa.text('created_at DESC')],
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_index('idx_post_author_created_desc', table_name='posts', if_exists=True)
+    op.drop_index('idx_post_created_desc', table_name='posts', if_exists=True)
+    op.create_index('idx_post_author_created', 'posts', ['author_id', 'created_at'])
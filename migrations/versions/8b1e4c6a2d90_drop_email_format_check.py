@@ -0,0 +1,27 @@
+"""drop email format check
+
+Revision ID: 8b1e4c6a2d90
+Revises: 3f9c2b7d41a8
+Create Date: 2026-10-15 14:05:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8b1e4c6a2d90'
+down_revision = '3f9c2b7d41a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite cannot drop a constraint without rebuilding the table; the
+    # leftover CHECK there is harmless and goes away on the next rebuild
+    if op.get_bind().dialect.name != 'sqlite':
+        op.drop_constraint('email_format', 'users', type_='check')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        op.create_check_constraint('email_format', 'users', "email LIKE '%@%'")
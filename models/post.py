@@ -49,8 +49,9 @@ class Post(db.Model, TimestampMixin):
         db.CheckConstraint('length(title) > 0', name='title_not_empty'),
         # Ensure content has minimum length
         db.CheckConstraint('length(content) >= 10', name='content_min_length'),
-        # Composite index for common queries
-        db.Index('idx_post_author_created', 'author_id', 'created_at'),
+        # Newest-first listings: global feed and posts by author
+        db.Index('idx_post_created_desc', db.text('created_at DESC'), db.text('id DESC')),
+        db.Index('idx_post_author_created_desc', 'author_id', db.text('created_at DESC')),
     )
     
     def __repr__(self):
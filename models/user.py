@@ -33,6 +33,7 @@ class User(db.Model, TimestampMixin):
         index=True
     )
     
+    # Format is validated by the request schemas, not a CHECK
     email = db.Column(
         db.String(120),
         unique=True,
@@ -55,10 +56,11 @@ class User(db.Model, TimestampMixin):
     is_active = db.Column(db.Boolean, default=True, nullable=False)
     
     # Relationships
+    # Plain (non-dynamic) so it can be eager-loaded
     posts = db.relationship(
         'Post',
         backref='author',
-        lazy='dynamic',
+        lazy='select',
         cascade='all, delete-orphan'
     )
     
@@ -66,8 +68,6 @@ class User(db.Model, TimestampMixin):
     __table_args__ = (
         # Ensure username is at least 3 characters
         db.CheckConstraint('length(username) >= 3', name='username_min_length'),
-        # Ensure email contains @
-        db.CheckConstraint("email LIKE '%@%'", name='email_format'),
         # Ensure role is valid
         db.CheckConstraint(
             "role IN ('user', 'admin')",
@@ -19,8 +19,16 @@ from flask_jwt_extended import (
 from pydantic import ValidationError as PydanticValidationError
 
 from services import AuthService, UserService
-from schemas import UserRegister, UserLogin, TokenResponse, UserResponse
-from utils import create_success_response, create_error_response
+from schemas import UserRegister, UserLogin
+from utils import (
+    create_success_response,
+    create_data_response,
+    create_error_response,
+    fast_token_response,
+    is_json_request,
+    format_validation_errors
+)
+from middleware import identity_claims
 from config import (
     AuthenticationError,
     DuplicateUserError,
@@ -53,12 +61,12 @@ def register():
         400: Validation error or duplicate user
         429: Rate limit exceeded
     """
-    if not request.is_json:
+    if not is_json_request(request):
         return create_error_response("Content-Type must be application/json", 400)
     
     try:
-        # Validate request with Pydantic
-        schema = UserRegister(**request.get_json())
+        # Validate request with Pydantic (parsed straight from the raw body)
+        schema = UserRegister.model_validate_json(request.get_data())
         
         # Register user
         user = AuthService.register_user(
@@ -68,16 +76,14 @@ def register():
         )
         
         # Create JWT tokens
-        access_token = create_access_token(identity=str(user.id))
+        access_token = create_access_token(
+            identity=str(user.id),
+            additional_claims=identity_claims(user)
+        )
         refresh_token = create_refresh_token(identity=str(user.id))
         
-        # Build response
-        response_data = TokenResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            expires_in=900,  # 15 minutes
-            user=UserResponse.model_validate(user)
-        )
+        # Build response (TokenResponse shape, 15 minute expiry)
+        response_data = fast_token_response(access_token, refresh_token, user)
         
         return create_success_response(
             data=response_data,
@@ -87,8 +93,7 @@ def register():
         
     except PydanticValidationError as e:
         # Pydantic validation errors
-        errors = [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
-        return create_error_response("; ".join(errors), 400)
+        return create_error_response(format_validation_errors(e), 400)
     except DuplicateUserError as e:
         return create_error_response(str(e), 400)
     except DatabaseError as e:
@@ -114,12 +119,12 @@ def login():
         401: Invalid credentials
         429: Rate limit exceeded
     """
-    if not request.is_json:
+    if not is_json_request(request):
         return create_error_response("Content-Type must be application/json", 400)
     
     try:
         # Validate request
-        schema = UserLogin(**request.get_json())
+        schema = UserLogin.model_validate_json(request.get_data())
         
         # Authenticate user
         user = AuthService.authenticate_user(
@@ -128,22 +133,19 @@ def login():
         )
         
         # Create JWT tokens
-        access_token = create_access_token(identity=str(user.id))
+        access_token = create_access_token(
+            identity=str(user.id),
+            additional_claims=identity_claims(user)
+        )
         refresh_token = create_refresh_token(identity=str(user.id))
         
-        # Build response
-        response_data = TokenResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            expires_in=900,  # 15 minutes
-            user=UserResponse.model_validate(user)
-        )
+        # Build response (TokenResponse shape, 15 minute expiry)
+        response_data = fast_token_response(access_token, refresh_token, user)
         
-        return create_success_response(data=response_data)
+        return create_data_response(response_data)
         
     except PydanticValidationError as e:
-        errors = [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
-        return create_error_response("; ".join(errors), 400)
+        return create_error_response(format_validation_errors(e), 400)
     except AuthenticationError as e:
         return create_error_response(str(e), 401)
 
@@ -172,15 +174,16 @@ def refresh():
             return create_error_response("Account is inactive", 401)
         
         # Create new access token
-        access_token = create_access_token(identity=str(user_id))
-        
-        return create_success_response(
-            data={
-                'access_token': access_token,
-                'token_type': 'Bearer',
-                'expires_in': 900
-            }
+        access_token = create_access_token(
+            identity=str(user_id),
+            additional_claims=identity_claims(user)
         )
         
+        return create_data_response({
+            'access_token': access_token,
+            'token_type': 'Bearer',
+            'expires_in': 900
+        })
+        
     except Exception as e:
         return create_error_response("Invalid or expired refresh token", 401)
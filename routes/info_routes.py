@@ -4,59 +4,78 @@ Info routes - API information and health check
 Endpoints:
 - GET / - API documentation
 - GET /health - Health check
+- GET /health/live - Liveness probe (no DB access)
+- GET /health/ready - Readiness probe (DB check, cached briefly)
 """
 
-from flask import Blueprint, jsonify
+import hashlib
+import time
+
+import orjson
+from flask import Blueprint, Response, current_app, jsonify, request
 from db import db
 
-info_bp = Blueprint('info', __name__)
+# Seconds a readiness result is reused before the DB is checked again
+READY_CHECK_TTL = 1.0
 
+info_bp = Blueprint('info', __name__)
 
-@info_bp.route('/', methods=['GET'])
-def home():
-    """API information and documentation"""
-    return jsonify({
-        'message': 'Blog API with Authentication',
-        'version': '1.0.0',
-        'features': [
-            'User registration and authentication',
-            'JWT access and refresh tokens',
-            'Role-based access control (User, Admin)',
-            'Blog post CRUD operations',
-            'Ownership-based authorization',
-            'Pydantic schema validation',
-            'Database constraints',
-            'Comprehensive security'
-        ],
-        'endpoints': {
-            'auth': {
-                'POST /auth/register': 'Register new user',
-                'POST /auth/login': 'Login and get tokens',
-                'POST /auth/refresh': 'Refresh access token'
-            },
-            'users': {
-                'GET /users/me': 'Get current user profile (auth required)',
-                'PUT /users/me': 'Update profile (auth required)'
-            },
-            'posts': {
-                'GET /posts': 'List all posts (public)',
-                'GET /posts/:id': 'Get specific post (public)',
-                'POST /posts': 'Create post (auth required)',
-                'PUT /posts/:id': 'Update own post (auth required)',
-                'DELETE /posts/:id': 'Delete own post or any post if admin (auth required)'
-            }
+# The home payload never changes at runtime: encode it and its ETag once
+_HOME_BODY = orjson.dumps({
+    'message': 'Blog API with Authentication',
+    'version': '1.0.0',
+    'features': [
+        'User registration and authentication',
+        'JWT access and refresh tokens',
+        'Role-based access control (User, Admin)',
+        'Blog post CRUD operations',
+        'Ownership-based authorization',
+        'Pydantic schema validation',
+        'Database constraints',
+        'Comprehensive security'
+    ],
+    'endpoints': {
+        'auth': {
+            'POST /auth/register': 'Register new user',
+            'POST /auth/login': 'Login and get tokens',
+            'POST /auth/refresh': 'Refresh access token'
         },
-        'authentication': {
-            'type': 'JWT (JSON Web Token)',
-            'header': 'Authorization: Bearer <token>',
-            'access_token_expires': '15 minutes',
-            'refresh_token_expires': '7 days'
+        'users': {
+            'GET /users/me': 'Get current user profile (auth required)',
+            'PUT /users/me': 'Update profile (auth required)'
         },
-        'authorization': {
-            'user': 'Can CRUD own posts',
-            'admin': 'Can delete any post'
+        'posts': {
+            'GET /posts': 'List all posts (public)',
+            'GET /posts/:id': 'Get specific post (public)',
+            'POST /posts': 'Create post (auth required)',
+            'PUT /posts/:id': 'Update own post (auth required)',
+            'DELETE /posts/:id': 'Delete own post or any post if admin (auth required)'
         }
-    }), 200
+    },
+    'authentication': {
+        'type': 'JWT (JSON Web Token)',
+        'header': 'Authorization: Bearer <token>',
+        'access_token_expires': '15 minutes',
+        'refresh_token_expires': '7 days'
+    },
+    'authorization': {
+        'user': 'Can CRUD own posts',
+        'admin': 'Can delete any post'
+    }
+})
+_HOME_ETAG = hashlib.blake2b(_HOME_BODY, digest_size=16).hexdigest()
+_HOME_HEADERS = {
+    'Cache-Control': 'public, max-age=3600',
+    'ETag': f'"{_HOME_ETAG}"'
+}
+
+
+@info_bp.route('/', methods=['GET'])
+def home():
+    """API information and documentation (static, encoded at import)"""
+    if request.if_none_match.contains(_HOME_ETAG):
+        return Response(status=304, headers=_HOME_HEADERS)
+    return Response(_HOME_BODY, status=200, mimetype='application/json', headers=_HOME_HEADERS)
 
 
 @info_bp.route('/health', methods=['GET'])
@@ -79,3 +98,41 @@ def health_check():
             'database': 'disconnected',
             'error': str(e)
         }), 500
+
+
+@info_bp.route('/health/live', methods=['GET'])
+def liveness():
+    """Liveness probe - the process is up and serving requests"""
+    return jsonify({'status': 'ok'}), 200
+
+
+@info_bp.route('/health/ready', methods=['GET'])
+def readiness():
+    """
+    Readiness probe
+    
+    Checks the database on a raw pooled connection (no session), reusing
+    the result for READY_CHECK_TTL seconds so frequent probes don't add
+    database load.
+    """
+    now = time.monotonic()
+    cached = current_app.extensions.get('health_ready')
+    
+    if cached is None or now - cached[0] >= READY_CHECK_TTL:
+        try:
+            with db.engine.connect() as connection:
+                connection.exec_driver_sql('SELECT 1')
+            cached = (now, None)
+        except Exception as e:
+            cached = (now, str(e))
+        current_app.extensions['health_ready'] = cached
+    
+    error = cached[1]
+    if error is not None:
+        return jsonify({
+            'status': 'unavailable',
+            'database': 'disconnected',
+            'error': error
+        }), 503
+    
+    return jsonify({'status': 'ready', 'database': 'connected'}), 200
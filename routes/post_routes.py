@@ -11,13 +11,21 @@ Protected endpoints (authentication required):
 - DELETE /posts/:id - Delete own post (or any post if admin)
 """
 
-from flask import Blueprint, request
+from flask import Blueprint, Response, request, stream_with_context
 from pydantic import ValidationError as PydanticValidationError
+import hashlib
+import orjson
 
 from services import PostService
-from schemas import PostCreate, PostUpdate, PostResponse, PostBrief, PaginatedResponse
-from utils import create_success_response, create_error_response
-from middleware import jwt_required, get_current_user
+from schemas import PostCreate, PostUpdate, PostResponse, PaginatedResponse, construct_from_orm
+from utils import (
+    create_success_response,
+    create_error_response,
+    parse_keyset_cursor,
+    is_json_request,
+    format_validation_errors
+)
+from middleware import jwt_required, get_current_identity
 from config import (
     PostNotFoundError,
     AuthenticationError,
@@ -29,6 +37,45 @@ from config import (
 posts_bp = Blueprint('posts', __name__, url_prefix='/posts')
 
 
+def _post_brief_dict(post) -> dict:
+    """PostBrief fields read straight off a loaded Post (author eager-loaded)"""
+    author = post.author
+    return {
+        'id': post.id,
+        'title': post.title,
+        'created_at': post.created_at,
+        'author': {'id': author.id, 'username': author.username, 'role': author.role}
+    }
+
+
+def _post_etag(post) -> str:
+    """Entity tag for a post version (changes whenever updated_at does)"""
+    version = f"{post.id}:{post.updated_at.timestamp()}".encode()
+    return hashlib.blake2b(version, digest_size=16).hexdigest()
+
+
+def _stream_posts_json(result):
+    """
+    Yield a paginated post listing as the success envelope, one post at a time
+    
+    Args:
+        result: Paginated or KeysetPage from PostService (items are Post objects)
+        
+    Yields:
+        Chunks of the JSON body
+    """
+    meta = orjson.dumps(result.meta())
+    yield b'{"success":true,"data":{"items":['
+    
+    for i, post in enumerate(result.items):
+        if i:
+            yield b','
+        yield orjson.dumps(_post_brief_dict(post))
+    
+    # Pagination fields follow the items in the same object
+    yield b']' + (b',' + meta[1:] if len(meta) > 2 else b'}') + b'}'
+
+
 # ==================== PUBLIC ENDPOINTS ====================
 
 @posts_bp.route('', methods=['GET'])
@@ -39,6 +86,8 @@ def get_posts():
     Query parameters:
         page: Page number (default: 1)
         per_page: Items per page (default: 10, max: 100)
+        after: Keyset cursor ("<created_at>,<id>") from a previous
+               response's next_after; replaces page for deep paging
     
     Returns:
         200: Paginated list of posts
@@ -46,20 +95,18 @@ def get_posts():
     try:
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 10, type=int)
+        after = request.args.get('after')
         
-        result = PostService.get_all_posts(page=page, per_page=per_page)
-        
-        # Convert posts to brief schema
-        posts_brief = [PostBrief.model_validate(post) for post in result['items']]
+        result = PostService.get_all_posts(
+            page=page,
+            per_page=per_page,
+            after=parse_keyset_cursor(after) if after else None
+        )
         
-        return create_success_response(
-            data={
-                'items': [p.model_dump() for p in posts_brief],
-                'total': result['total'],
-                'page': result['page'],
-                'per_page': result['per_page'],
-                'pages': result['pages']
-            }
+        # Stream the PostBrief list instead of building it in memory
+        return Response(
+            stream_with_context(_stream_posts_json(result)),
+            mimetype='application/json'
         )
         
     except ValidationError as e:
@@ -73,15 +120,31 @@ def get_post(post_id):
     """
     Get specific post by ID (PUBLIC)
     
+    Responses carry an ETag derived from the post's updated_at; a matching
+    If-None-Match gets 304 without serializing the post. Caches must
+    revalidate every time (no-cache), so edits and deletes show at once.
+    
     Returns:
         200: Post details
+        304: Not modified
         404: Post not found
     """
     try:
         post = PostService.get_post_by_id(post_id)
-        return create_success_response(
-            data=PostResponse.model_validate(post)
+        
+        etag = _post_etag(post)
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+        
+        response, status = create_success_response(
+            data=construct_from_orm(PostResponse, post)
         )
+        response.set_etag(etag)
+        response.cache_control.no_cache = True
+        return response, status
         
     except PostNotFoundError as e:
         return create_error_response(str(e), 404)
@@ -111,11 +174,11 @@ def create_post():
         400: Validation error
         401: Unauthorized
     """
-    if not request.is_json:
+    if not is_json_request(request):
         return create_error_response("Content-Type must be application/json", 400)
     
     try:
-        user = get_current_user()
+        user_id, _ = get_current_identity()
         
         # Validate request
         schema = PostCreate(**request.get_json())
@@ -124,18 +187,17 @@ def create_post():
         post = PostService.create_post(
             title=schema.title,
             content=schema.content,
-            author_id=user.id
+            author_id=user_id
         )
         
         return create_success_response(
-            data=PostResponse.model_validate(post),
+            data=construct_from_orm(PostResponse, post),
             message="Post created successfully",
             status_code=201
         )
         
     except PydanticValidationError as e:
-        errors = [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
-        return create_error_response("; ".join(errors), 400)
+        return create_error_response(format_validation_errors(e), 400)
     except AuthenticationError as e:
         return create_error_response(str(e), 401)
     except DatabaseError as e:
@@ -164,11 +226,11 @@ def update_post(post_id):
         403: Forbidden (not post owner)
         404: Post not found
     """
-    if not request.is_json:
+    if not is_json_request(request):
         return create_error_response("Content-Type must be application/json", 400)
     
     try:
-        user = get_current_user()
+        user_id, _ = get_current_identity()
         
         # Validate request
         schema = PostUpdate(**request.get_json())
@@ -176,19 +238,18 @@ def update_post(post_id):
         # Update post
         post = PostService.update_post(
             post_id=post_id,
-            user_id=user.id,
+            user_id=user_id,
             title=schema.title,
             content=schema.content
         )
         
         return create_success_response(
-            data=PostResponse.model_validate(post),
+            data=construct_from_orm(PostResponse, post),
             message="Post updated successfully"
         )
         
     except PydanticValidationError as e:
-        errors = [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
-        return create_error_response("; ".join(errors), 400)
+        return create_error_response(format_validation_errors(e), 400)
     except PostNotFoundError as e:
         return create_error_response(str(e), 404)
     except AuthenticationError as e:
@@ -218,13 +279,13 @@ def delete_post(post_id):
         404: Post not found
     """
     try:
-        user = get_current_user()
+        user_id, user_role = get_current_identity()
         
         # Delete post (checks ownership/admin in service)
         post = PostService.delete_post(
             post_id=post_id,
-            user_id=user.id,
-            user_role=user.role
+            user_id=user_id,
+            user_role=user_role
         )
         
         return create_success_response(
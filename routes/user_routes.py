@@ -10,8 +10,8 @@ from flask import Blueprint, request
 from pydantic import ValidationError as PydanticValidationError
 
 from services import UserService
-from schemas import UserResponse, UserUpdate
-from utils import create_success_response, create_error_response
+from schemas import UserResponse, UserUpdate, construct_from_orm
+from utils import create_success_response, create_error_response, is_json_request, format_validation_errors
 from middleware import jwt_required, get_current_user
 from config import (
     AuthenticationError,
@@ -38,7 +38,7 @@ def get_profile():
     try:
         user = get_current_user()
         return create_success_response(
-            data=UserResponse.model_validate(user)
+            data=construct_from_orm(UserResponse, user)
         )
         
     except AuthenticationError as e:
@@ -65,7 +65,7 @@ def update_profile():
         400: Validation error
         401: Unauthorized
     """
-    if not request.is_json:
+    if not is_json_request(request):
         return create_error_response("Content-Type must be application/json", 400)
     
     try:
@@ -82,13 +82,12 @@ def update_profile():
         )
         
         return create_success_response(
-            data=UserResponse.model_validate(updated_user),
+            data=construct_from_orm(UserResponse, updated_user),
             message="Profile updated successfully"
         )
         
     except PydanticValidationError as e:
-        errors = [f"{err['loc'][0]}: {err['msg']}" for err in e.errors()]
-        return create_error_response("; ".join(errors), 400)
+        return create_error_response(format_validation_errors(e), 400)
     except DuplicateUserError as e:
         return create_error_response(str(e), 400)
     except AuthenticationError as e:
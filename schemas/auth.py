@@ -7,7 +7,7 @@ Provides:
 """
 
 from pydantic import BaseModel, Field
-from .user import UserResponse
+from .user import UserResponse, USER_RESPONSE_EXAMPLE
 
 
 class TokenResponse(BaseModel):
@@ -23,20 +23,14 @@ class TokenResponse(BaseModel):
     user: UserResponse = Field(..., description="User information")
     
     class Config:
+        frozen = True  # Read-only response DTO
         json_schema_extra = {
             "example": {
                 "access_token": "eyJ0eXAiOiJKV1QiLCJhbGc...",
                 "refresh_token": "eyJ0eXAiOiJKV1QiLCJhbGc...",
                 "token_type": "Bearer",
                 "expires_in": 900,
-                "user": {
-                    "id": 1,
-                    "username": "john_doe",
-                    "email": "john@example.com",
-                    "role": "user",
-                    "is_active": True,
-                    "created_at": "2024-01-15T10:30:00"
-                }
+                "user": USER_RESPONSE_EXAMPLE
             }
         }
 
@@ -4,7 +4,8 @@ Common schemas - Reusable Pydantic models
 Provides standard response formats used across the API.
 """
 
-from typing import Generic, TypeVar, List, Any
+from functools import lru_cache
+from typing import Generic, TypeVar, List, Any, Type
 from pydantic import BaseModel
 
 
@@ -46,3 +47,45 @@ class PaginatedResponse(BaseModel, Generic[T]):
                 "pages": 10
             }
         }
+
+
+M = TypeVar('M', bound=BaseModel)
+
+
+def construct_from_orm(schema: Type[M], obj: Any) -> M:
+    """
+    Build a response schema from a trusted ORM object without validation
+    
+    Uses model_construct, recursing into nested schema fields (e.g. author).
+    Only use with data loaded from the database - never with request input.
+    
+    Args:
+        schema: Pydantic model class to build
+        obj: SQLAlchemy model instance
+        
+    Returns:
+        Schema instance populated from obj's attributes
+    """
+    values = {}
+    for name, nested in _field_plan(schema):
+        value = getattr(obj, name)
+        if nested is not None and value is not None:
+            value = construct_from_orm(nested, value)
+        values[name] = value
+    return schema.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
+def _field_plan(schema: Type[BaseModel]) -> tuple:
+    """
+    Field names of a schema paired with their nested schema class (or None)
+    
+    Computed once per schema so construct_from_orm does no type
+    introspection per object.
+    """
+    plan = []
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        nested = annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else None
+        plan.append((name, nested))
+    return tuple(plan)
@@ -10,7 +10,7 @@ Provides validation and serialization for:
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
-from .user import UserBrief
+from .user import UserBrief, USER_BRIEF_EXAMPLE
 
 
 class PostCreate(BaseModel):
@@ -68,6 +68,7 @@ class PostBrief(BaseModel):
     author: UserBrief
     
     class Config:
+        frozen = True  # Read-only response DTO
         from_attributes = True
 
 
@@ -85,6 +86,7 @@ class PostResponse(BaseModel):
     author: UserBrief  # Nested user info
     
     class Config:
+        frozen = True  # Read-only response DTO
         from_attributes = True  # Allows conversion from SQLAlchemy models
         json_schema_extra = {
             "example": {
@@ -93,10 +95,6 @@ class PostResponse(BaseModel):
                 "content": "This is the full content...",
                 "created_at": "2024-01-15T10:30:00",
                 "updated_at": "2024-01-15T10:30:00",
-                "author": {
-                    "id": 1,
-                    "username": "john_doe",
-                    "role": "user"
-                }
+                "author": USER_BRIEF_EXAMPLE
             }
         }
@@ -9,10 +9,116 @@ Provides validation and serialization for:
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from functools import lru_cache
+from typing import Annotated, Optional
+from pydantic import AfterValidator, BaseModel, Field, field_validator
 import re
 
+# Username pattern, compiled once at import
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_]+$')
+
+# Examples reused by other schemas' docs (one shared object each)
+USER_BRIEF_EXAMPLE = {
+    "id": 1,
+    "username": "john_doe",
+    "role": "user"
+}
+USER_RESPONSE_EXAMPLE = {
+    "id": 1,
+    "username": "john_doe",
+    "email": "john@example.com",
+    "role": "user",
+    "is_active": True,
+    "created_at": "2024-01-15T10:30:00"
+}
+
+# Syntax-only email check (no deliverability/DNS or IDN normalization).
+# Apply with fullmatch: `$` alone would also accept a trailing newline.
+_EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$')
+
+# Password character classes as bits, looked up per ASCII byte
+_UPPER, _LOWER, _DIGIT, _SPECIAL = 1, 2, 4, 8
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT | _SPECIAL
+_SPECIAL_CHARS = '!@#$%^&*(),.?":{}|<>'
+_CHAR_CLASS = bytes(
+    _UPPER if 'A' <= chr(b) <= 'Z'
+    else _LOWER if 'a' <= chr(b) <= 'z'
+    else _DIGIT if '0' <= chr(b) <= '9'
+    else _SPECIAL if chr(b) in _SPECIAL_CHARS
+    else 0
+    for b in range(256)
+)
+
+
+@lru_cache(maxsize=4096)
+def _check_email(v: str) -> str:
+    """
+    Validate email syntax and normalize to lowercase
+    
+    Valid addresses are cached; failures raise.
+    
+    Args:
+        v: Email address
+        
+    Returns:
+        The address in lowercase
+        
+    Raises:
+        ValueError: If the address is not a valid email
+    """
+    if len(v) > 120 or not _EMAIL_RE.fullmatch(v):
+        raise ValueError('value is not a valid email address')
+    return v.lower()
+
+
+# Email address validated and lowercased by _check_email
+Email = Annotated[str, AfterValidator(_check_email)]
+
+
+def _validate_password_strength(v: str) -> str:
+    """
+    Check a password against the strength rules
+    
+    Requirements:
+    - At least 8 characters
+    - At least one uppercase letter
+    - At least one lowercase letter
+    - At least one digit
+    - At least one special character
+    
+    Args:
+        v: Plain text password
+        
+    Returns:
+        The password unchanged
+        
+    Raises:
+        ValueError: If a requirement is not met
+    """
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    
+    # Single pass over the bytes, stopping once every class has been seen
+    mask = 0
+    for b in v.encode('ascii', 'ignore'):
+        mask |= _CHAR_CLASS[b]
+        if mask == _ALL_CLASSES:
+            return v
+    
+    if not mask & _UPPER:
+        raise ValueError('Password must contain at least one uppercase letter')
+    
+    if not mask & _LOWER:
+        raise ValueError('Password must contain at least one lowercase letter')
+    
+    if not mask & _DIGIT:
+        raise ValueError('Password must contain at least one digit')
+    
+    if not mask & _SPECIAL:
+        raise ValueError('Password must contain at least one special character')
+    
+    return v
+
 
 class UserRegister(BaseModel):
     """
@@ -29,7 +135,7 @@ class UserRegister(BaseModel):
         max_length=50,
         description="Username (3-50 characters, alphanumeric and underscore only)"
     )
-    email: EmailStr = Field(..., description="Valid email address")
+    email: Email = Field(..., description="Valid email address")
     password: str = Field(
         ...,
         min_length=8,
@@ -40,39 +146,15 @@ class UserRegister(BaseModel):
     @classmethod
     def validate_username(cls, v):
         """Validate username format"""
-        if not re.match(r'^[a-zA-Z0-9_]+$', v):
+        if not _USERNAME_RE.match(v):
             raise ValueError('Username must contain only letters, numbers, and underscores')
         return v.lower()  # Store as lowercase
     
     @field_validator('password')
     @classmethod
     def validate_password(cls, v):
-        """
-        Validate password strength
-        
-        Requirements:
-        - At least 8 characters
-        - At least one uppercase letter
-        - At least one lowercase letter
-        - At least one digit
-        - At least one special character
-        """
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character')
-        
-        return v
+        """Validate password strength (see _validate_password_strength)"""
+        return _validate_password_strength(v)
     
     class Config:
         json_schema_extra = {
@@ -89,6 +171,12 @@ class UserLogin(BaseModel):
     username: str = Field(..., description="Username or email")
     password: str = Field(..., description="User password")
     
+    @field_validator('username')
+    @classmethod
+    def normalize_username(cls, v):
+        """Lowercase the username/email (stored lowercase)"""
+        return v.lower()
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -105,7 +193,9 @@ class UserBrief(BaseModel):
     role: str
     
     class Config:
+        frozen = True  # Read-only response DTO
         from_attributes = True
+        json_schema_extra = {"example": USER_BRIEF_EXAMPLE}
 
 
 class UserResponse(BaseModel):
@@ -118,22 +208,14 @@ class UserResponse(BaseModel):
     created_at: datetime
     
     class Config:
+        frozen = True  # Read-only response DTO
         from_attributes = True  # Allows conversion from SQLAlchemy models
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "username": "john_doe",
-                "email": "john@example.com",
-                "role": "user",
-                "is_active": True,
-                "created_at": "2024-01-15T10:30:00"
-            }
-        }
+        json_schema_extra = {"example": USER_RESPONSE_EXAMPLE}
 
 
 class UserUpdate(BaseModel):
     """Schema for updating user profile"""
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     password: Optional[str] = Field(None, min_length=8)
     
     @field_validator('password')
@@ -144,16 +226,7 @@ class UserUpdate(BaseModel):
             return v
         
         # Same validation as registration
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one digit')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character')
-        
-        return v
+        return _validate_password_strength(v)
     
     class Config:
         json_schema_extra = {
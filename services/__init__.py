@@ -6,6 +6,12 @@ Contains all business logic separated from HTTP concerns.
 
 from .auth_service import AuthService
 from .user_service import UserService
-from .post_service import PostService
+from .post_service import PostService, Paginated, KeysetPage
 
-__all__ = ['AuthService', 'UserService', 'PostService']
\ No newline at end of file
+__all__ = [
+    'AuthService',
+    'UserService',
+    'PostService',
+    'Paginated',
+    'KeysetPage'
+]
\ No newline at end of file
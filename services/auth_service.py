@@ -5,10 +5,14 @@ Business logic for:
 - User registration
 - User login
 - Password verification
+
+Usernames and emails arrive already lowercased by the request schemas
+(schemas/user.py); they are stored and looked up as given.
 """
 
+from sqlalchemy import or_, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from db import db
+from db import db, violated_unique_column
 from models import User
 from utils.security import hash_password, verify_password
 from config import (
@@ -17,6 +21,18 @@ from config import (
     DatabaseError
 )
 
+# Hash checked against when no user matches, so unknown usernames cost
+# the same bcrypt work as wrong passwords (created on first use)
+_DUMMY_HASH = None
+
+
+def _dummy_password_hash() -> str:
+    """Return a throwaway hash at the configured bcrypt cost"""
+    global _DUMMY_HASH
+    if _DUMMY_HASH is None:
+        _DUMMY_HASH = hash_password('dummy-password-for-timing')
+    return _DUMMY_HASH
+
 
 class AuthService:
     """Service for authentication operations"""
@@ -27,8 +43,8 @@ class AuthService:
         Register a new user
         
         Args:
-            username: Unique username
-            email: Unique email address
+            username: Unique username (lowercase)
+            email: Unique email address (lowercase)
             password: Plain text password (will be hashed)
             role: User role (default: 'user')
             
@@ -39,14 +55,16 @@ class AuthService:
             DuplicateUserError: If username or email already exists
             DatabaseError: If database operation fails
         """
-        # Check if username exists
-        existing_user = User.query.filter_by(username=username.lower()).first()
-        if existing_user:
+        # Check both unique columns in one round-trip, reading only those
+        # columns, so duplicates are rejected before paying for bcrypt
+        taken = db.session.execute(
+            select(User.username, User.email).where(
+                or_(User.username == username, User.email == email)
+            ).limit(2)
+        ).all()
+        if any(row.username == username for row in taken):
             raise DuplicateUserError('username', username)
-        
-        # Check if email exists
-        existing_email = User.query.filter_by(email=email.lower()).first()
-        if existing_email:
+        if taken:
             raise DuplicateUserError('email', email)
         
         try:
@@ -55,8 +73,8 @@ class AuthService:
             
             # Create user
             user = User(
-                username=username.lower(),
-                email=email.lower(),
+                username=username,
+                email=email,
                 password_hash=password_hash,
                 role=role,
                 is_active=True
@@ -70,9 +88,10 @@ class AuthService:
         except IntegrityError as e:
             db.session.rollback()
             # Database constraint violation
-            if 'username' in str(e).lower():
+            column = violated_unique_column(e)
+            if column == 'username':
                 raise DuplicateUserError('username', username)
-            elif 'email' in str(e).lower():
+            elif column == 'email':
                 raise DuplicateUserError('email', email)
             else:
                 raise DatabaseError(f"Failed to create user: {str(e)}")
@@ -86,7 +105,7 @@ class AuthService:
         Authenticate user with username/email and password
         
         Args:
-            username: Username or email
+            username: Username or email (lowercase)
             password: Plain text password
             
         Returns:
@@ -95,12 +114,16 @@ class AuthService:
         Raises:
             AuthenticationError: If credentials are invalid
         """
-        # Try to find user by username or email
-        user = User.query.filter(
-            (User.username == username.lower()) | (User.email == username.lower())
-        ).first()
+        # Usernames cannot contain '@' and emails must, so the input shape
+        # picks the column and the lookup is a single unique-index probe
+        if '@' in username:
+            user = User.query.filter_by(email=username).first()
+        else:
+            user = User.query.filter_by(username=username).first()
         
         if not user:
+            # Spend the same time as a real check to avoid username enumeration
+            verify_password(password, _dummy_password_hash())
             raise AuthenticationError("Invalid username or password")
         
         # Check if account is active
@@ -8,7 +8,12 @@ Business logic for:
 - Deleting posts (with ownership/admin check)
 """
 
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import delete, select, tuple_, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers, selectinload
 from db import db
 from models import Post, User
 from utils.validators import validate_pagination
@@ -19,21 +24,76 @@ from config import (
     ValidationError
 )
 
+@dataclass(frozen=True, slots=True)
+class Paginated:
+    """One page of an OFFSET-paginated listing"""
+    items: list
+    total: int
+    page: int
+    per_page: int
+    pages: int
+    next_after: Optional[str] = None
+    
+    def meta(self) -> dict:
+        """Pagination fields (everything but items)"""
+        return {
+            'total': self.total,
+            'page': self.page,
+            'per_page': self.per_page,
+            'pages': self.pages,
+            'next_after': self.next_after
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetPage:
+    """One page of a keyset-paginated listing"""
+    items: list
+    per_page: int
+    next_after: Optional[str]
+    
+    def meta(self) -> dict:
+        """Pagination fields (everything but items)"""
+        return {'per_page': self.per_page, 'next_after': self.next_after}
+
+
+# Newest-first listing; built once so every call reuses the same cached
+# compiled statement with only the LIMIT/OFFSET/cursor values bound.
+# Mappers are configured first so the Post.author backref exists.
+configure_mappers()
+_POSTS_STMT = select(Post).options(
+    selectinload(Post.author)
+).order_by(
+    Post.created_at.desc(),
+    Post.id.desc()
+)
+
+
+def _cursor_after(post: Post) -> str:
+    """Keyset cursor ("<created_at>,<id>") pointing just past `post`"""
+    return f"{post.created_at.isoformat()},{post.id}"
+
 
 class PostService:
     """Service for post operations"""
     
     @staticmethod
-    def get_all_posts(page: int = 1, per_page: int = 10) -> dict:
+    def get_all_posts(page: int = 1, per_page: int = 10, after: tuple = None):
         """
         Get all posts with pagination
         
+        With `after` (a (created_at, id) keyset cursor) the page is read with
+        a seek on the (created_at, id) index instead of OFFSET, and no total
+        count is computed. Offset pages include the cursor for the next page
+        so clients can switch to `after` from the first page on.
+        
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed, ignored when `after` is given)
             per_page: Items per page
+            after: Keyset cursor from a previous page's `next_after`
             
         Returns:
-            Dictionary with posts and pagination info
+            Paginated, or KeysetPage when `after` is given
             
         Raises:
             ValidationError: If pagination parameters are invalid
@@ -43,22 +103,39 @@ class PostService:
         page, per_page = validate_pagination(page, per_page)
         
         try:
-            # Query posts ordered by creation date (newest first)
-            paginated = Post.query.order_by(
-                Post.created_at.desc()
-            ).paginate(
+            if after is not None:
+                rows = db.session.scalars(
+                    _POSTS_STMT.where(
+                        tuple_(Post.created_at, Post.id) < after
+                    ).limit(per_page + 1)
+                ).all()
+                
+                items = rows[:per_page]
+                next_after = _cursor_after(items[-1]) if len(rows) > per_page else None
+                
+                return KeysetPage(items=items, per_page=per_page, next_after=next_after)
+            
+            paginated = db.paginate(
+                _POSTS_STMT,
                 page=page,
                 per_page=per_page,
                 error_out=False
             )
             
-            return {
-                'items': paginated.items,
-                'total': paginated.total,
-                'page': page,
-                'per_page': per_page,
-                'pages': paginated.pages
-            }
+            # Hand out a cursor so clients can continue with keyset paging
+            # instead of paying for ever-larger OFFSETs
+            next_after = None
+            if paginated.has_next and paginated.items:
+                next_after = _cursor_after(paginated.items[-1])
+            
+            return Paginated(
+                items=paginated.items,
+                total=paginated.total,
+                page=page,
+                per_page=per_page,
+                pages=paginated.pages,
+                next_after=next_after
+            )
             
         except SQLAlchemyError as e:
             raise DatabaseError(f"Failed to fetch posts: {str(e)}")
@@ -77,13 +154,15 @@ class PostService:
         Raises:
             PostNotFoundError: If post doesn't exist
         """
-        post = db.session.get(Post, post_id)
+        post = db.session.get(
+            Post, post_id, options=[selectinload(Post.author)]
+        )
         if not post:
             raise PostNotFoundError(post_id)
         return post
     
     @staticmethod
-    def get_posts_by_user(user_id: int, page: int = 1, per_page: int = 10) -> dict:
+    def get_posts_by_user(user_id: int, page: int = 1, per_page: int = 10) -> Paginated:
         """
         Get posts by specific user with pagination
         
@@ -93,7 +172,7 @@ class PostService:
             per_page: Items per page
             
         Returns:
-            Dictionary with posts and pagination info
+            Paginated page of posts
             
         Raises:
             ValidationError: If pagination parameters are invalid
@@ -103,23 +182,21 @@ class PostService:
         page, per_page = validate_pagination(page, per_page)
         
         try:
-            paginated = Post.query.filter_by(
-                author_id=user_id
-            ).order_by(
-                Post.created_at.desc()
-            ).paginate(
+            # Same eager-loaded, newest-first statement as the global feed
+            paginated = db.paginate(
+                _POSTS_STMT.where(Post.author_id == user_id),
                 page=page,
                 per_page=per_page,
                 error_out=False
             )
             
-            return {
-                'items': paginated.items,
-                'total': paginated.total,
-                'page': page,
-                'per_page': per_page,
-                'pages': paginated.pages
-            }
+            return Paginated(
+                items=paginated.items,
+                total=paginated.total,
+                page=page,
+                per_page=per_page,
+                pages=paginated.pages
+            )
             
         except SQLAlchemyError as e:
             raise DatabaseError(f"Failed to fetch user posts: {str(e)}")
@@ -177,20 +254,40 @@ class PostService:
             AuthorizationError: If user is not the author
             DatabaseError: If database operation fails
         """
-        post = PostService.get_post_by_id(post_id)
+        changes = {}
+        if title is not None:
+            changes['title'] = title
+        if content is not None:
+            changes['content'] = content
         
-        # Check ownership
-        if not post.is_author(user_id):
-            raise AuthorizationError("You can only update your own posts")
+        if not changes:
+            post = PostService.get_post_by_id(post_id)
+            if not post.is_author(user_id):
+                raise AuthorizationError("You can only update your own posts")
+            return post
         
         try:
-            # Update fields if provided
-            if title is not None:
-                post.title = title
-            if content is not None:
-                post.content = content
+            # Ownership is part of the WHERE clause: one UPDATE ... RETURNING
+            post = db.session.execute(
+                update(Post).where(
+                    Post.id == post_id,
+                    Post.author_id == user_id
+                ).values(**changes).returning(Post).options(selectinload(Post.author))
+            ).scalar_one_or_none()
             
-            db.session.commit()
+            if post is None:
+                db.session.rollback()
+                PostService._raise_not_found_or_forbidden(post_id, "You can only update your own posts")
+            
+            # Keep the returned row and its author loaded for the response
+            # (the author may be shared with the rest of the request)
+            session = db.session()
+            expire_on_commit = session.expire_on_commit
+            session.expire_on_commit = False
+            try:
+                session.commit()
+            finally:
+                session.expire_on_commit = expire_on_commit
             return post
             
         except SQLAlchemyError as e:
@@ -218,18 +315,37 @@ class PostService:
             AuthorizationError: If user lacks permission
             DatabaseError: If database operation fails
         """
-        post = PostService.get_post_by_id(post_id)
-        
-        # Check authorization
-        # Admin can delete any post, or user can delete their own post
-        if user_role != 'admin' and not post.is_author(user_id):
-            raise AuthorizationError("You can only delete your own posts")
+        # Admin can delete any post, or user can delete their own post;
+        # the check is part of the DELETE so the happy path is one statement
+        stmt = delete(Post).where(Post.id == post_id)
+        if user_role != 'admin':
+            stmt = stmt.where(Post.author_id == user_id)
         
         try:
-            db.session.delete(post)
+            post = db.session.execute(stmt.returning(Post)).scalar_one_or_none()
+            
+            if post is None:
+                db.session.rollback()
+                PostService._raise_not_found_or_forbidden(post_id, "You can only delete your own posts")
+            
+            # Detach so commit doesn't expire the returned row's attributes
+            db.session.expunge(post)
             db.session.commit()
             return post
             
         except SQLAlchemyError as e:
             db.session.rollback()
             raise DatabaseError(f"Failed to delete post: {str(e)}")
+    
+    @staticmethod
+    def _raise_not_found_or_forbidden(post_id: int, message: str):
+        """
+        Explain why a guarded UPDATE/DELETE matched no row
+        
+        Raises:
+            PostNotFoundError: If the post doesn't exist
+            AuthorizationError: If it exists but the user may not modify it
+        """
+        if db.session.get(Post, post_id) is None:
+            raise PostNotFoundError(post_id)
+        raise AuthorizationError(message)
@@ -7,8 +7,9 @@ Business logic for:
 - User account management
 """
 
+from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from db import db
+from db import db, violated_unique_column
 from models import User
 from utils.security import hash_password
 from config import (
@@ -66,7 +67,7 @@ class UserService:
         
         Args:
             user_id: User ID
-            email: New email (optional)
+            email: New email, already lowercased by UserUpdate (optional)
             password: New password (optional)
             
         Returns:
@@ -84,14 +85,14 @@ class UserService:
             if email:
                 # Check if email is already taken by another user
                 existing = User.query.filter(
-                    User.email == email.lower(),
+                    User.email == email,
                     User.id != user_id
                 ).first()
                 
                 if existing:
                     raise DuplicateUserError('email', email)
                 
-                user.email = email.lower()
+                user.email = email
             
             # Update password if provided
             if password:
@@ -102,7 +103,7 @@ class UserService:
             
         except IntegrityError as e:
             db.session.rollback()
-            if 'email' in str(e).lower():
+            if violated_unique_column(e) == 'email':
                 raise DuplicateUserError('email', email)
             else:
                 raise DatabaseError(f"Failed to update user: {str(e)}")
@@ -125,10 +126,16 @@ class UserService:
             UserNotFoundError: If user doesn't exist
             DatabaseError: If database operation fails
         """
-        user = UserService.get_user_by_id(user_id)
-        
         try:
-            user.is_active = False
+            # Single UPDATE ... RETURNING, no SELECT of the row first
+            user = db.session.execute(
+                update(User).where(User.id == user_id).values(is_active=False).returning(User)
+            ).scalar_one_or_none()
+            
+            if user is None:
+                db.session.rollback()
+                raise UserNotFoundError(user_id)
+            
             db.session.commit()
             return user
             
@@ -3,26 +3,44 @@ Pytest fixtures - Shared test utilities
 
 Provides fixtures for:
 - Flask app with test configuration
-- Database setup/teardown
+- Database setup (schema once per session, tables emptied per test;
+  the database is in-memory, so each pytest-xdist worker has its own)
 - Test client
 - Sample users and tokens
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
+import bcrypt
 import pytest
+from flask_jwt_extended import create_access_token
 from app import create_app
 from db import db
+from middleware import identity_claims
 from models import User, Post
 from utils.security import hash_password
 
 
-@pytest.fixture(scope='function')
-def app():
-    """Create Flask app with test configuration"""
+@pytest.fixture(scope='session', autouse=True)
+def _memoized_checkpw():
+    """Verify each fixture password/hash pair with bcrypt once per session"""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(bcrypt, 'checkpw', lru_cache(maxsize=1024)(bcrypt.checkpw))
+        yield
+
+
+@pytest.fixture(scope='session')
+def _app():
+    """Create the Flask app and its schema once per test session"""
     import os
     os.environ['FLASK_ENV'] = 'testing'
     
     app = create_app()
     
+    # Guard against a second SQLAlchemy() instance sneaking in via another import path
+    assert app.extensions['sqlalchemy'] is db
+    
     with app.app_context():
         db.create_all()
         yield app
@@ -31,9 +49,50 @@ def app():
 
 
 @pytest.fixture(scope='function')
-def client(app):
-    """Create test client"""
-    return app.test_client()
+def app(_app):
+    """Flask app with test configuration and empty tables"""
+    yield _app
+    
+    # Empty the tables instead of dropping/recreating the schema per test.
+    # A per-test SAVEPOINT/ROLLBACK is not an option here: Flask-SQLAlchemy's
+    # Session.get_bind resolves every model to the app engine, so a session
+    # bound to an outer test connection would still commit on its own.
+    db.session.remove()
+    with db.engine.begin() as connection:
+        for table in reversed(db.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@lru_cache(maxsize=None)
+def _hashed(password):
+    """bcrypt hash of a fixture password, computed once per session"""
+    return hash_password(password)
+
+
+def _persist(obj):
+    """
+    Commit a fixture object and return it with its attributes still loaded
+    
+    The fixture's own session skips expire-on-commit, so no refresh SELECT
+    is needed before the object is handed to a test.
+    """
+    session = db.session()
+    session.expire_on_commit = False
+    session.add(obj)
+    session.commit()
+    return obj
+
+
+@pytest.fixture(scope='session')
+def _client(_app):
+    """One test client for the session (the API sets no cookies)"""
+    return _app.test_client()
+
+
+@pytest.fixture(scope='function')
+def client(app, _client):
+    """Test client (per-test table reset still comes from `app`)"""
+    return _client
 
 
 @pytest.fixture(scope='function')
@@ -49,14 +108,11 @@ def sample_user(app):
         user = User(
             username='testuser',
             email='test@example.com',
-            password_hash=hash_password('TestPass123!'),
+            password_hash=_hashed('TestPass123!'),
             role='user',
             is_active=True
         )
-        db.session.add(user)
-        db.session.commit()
-        db.session.refresh(user)
-        return user
+        return _persist(user)
 
 
 @pytest.fixture(scope='function')
@@ -66,36 +122,52 @@ def sample_admin(app):
         admin = User(
             username='admin',
             email='admin@example.com',
-            password_hash=hash_password('AdminPass123!'),
+            password_hash=_hashed('AdminPass123!'),
             role='admin',
             is_active=True
         )
-        db.session.add(admin)
-        db.session.commit()
-        db.session.refresh(admin)
-        return admin
+        return _persist(admin)
 
 
 @pytest.fixture(scope='function')
-def user_token(client, sample_user):
-    """Get JWT token for regular user"""
-    response = client.post('/auth/login', json={
-        'username': 'testuser',
-        'password': 'TestPass123!'
-    })
-    data = response.get_json()
-    return data['data']['access_token']
+def other_user(app):
+    """Create a second regular user (not the sample_post author)"""
+    with app.app_context():
+        user = User(
+            username='otheruser',
+            email='other@example.com',
+            password_hash=_hashed('OtherPass123!'),
+            role='user',
+            is_active=True
+        )
+        return _persist(user)
+
+
+def _issue_token(app, user):
+    """Mint an access token the way /auth/login does, without bcrypt"""
+    with app.app_context():
+        return create_access_token(
+            identity=str(user.id),
+            additional_claims=identity_claims(user)
+        )
 
 
 @pytest.fixture(scope='function')
-def admin_token(client, sample_admin):
+def user_token(app, sample_user):
+    """Get JWT token for regular user (login itself is covered in test_auth)"""
+    return _issue_token(app, sample_user)
+
+
+@pytest.fixture(scope='function')
+def admin_token(app, sample_admin):
     """Get JWT token for admin user"""
-    response = client.post('/auth/login', json={
-        'username': 'admin',
-        'password': 'AdminPass123!'
-    })
-    data = response.get_json()
-    return data['data']['access_token']
+    return _issue_token(app, sample_admin)
+
+
+@pytest.fixture(scope='function')
+def other_user_token(app, other_user):
+    """Get JWT token for the second regular user"""
+    return _issue_token(app, other_user)
 
 
 @pytest.fixture(scope='function')
@@ -107,19 +179,22 @@ def sample_post(app, sample_user):
             content='This is a test post content with enough characters.',
             author_id=sample_user.id
         )
-        db.session.add(post)
-        db.session.commit()
-        db.session.refresh(post)
-        return post
+        return _persist(post)
+
+
+@lru_cache(maxsize=None)
+def _bearer_headers(token):
+    """Read-only Authorization headers, built once per distinct token"""
+    return MappingProxyType({'Authorization': f'Bearer {token}'})
 
 
 @pytest.fixture(scope='function')
 def auth_headers(user_token):
     """Get authorization headers with user token"""
-    return {'Authorization': f'Bearer {user_token}'}
+    return _bearer_headers(user_token)
 
 
 @pytest.fixture(scope='function')
 def admin_headers(admin_token):
     """Get authorization headers with admin token"""
-    return {'Authorization': f'Bearer {admin_token}'}
+    return _bearer_headers(admin_token)
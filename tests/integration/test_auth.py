@@ -9,19 +9,69 @@ Tests:
 - Duplicate user prevention
 """
 
+import orjson
 import pytest
 
 
+# Request bodies encoded once at import; tests post the bytes as-is
+REGISTER_NEWUSER = orjson.dumps({
+    'username': 'newuser',
+    'email': 'newuser@example.com',
+    'password': 'NewPassword123!'
+})
+REGISTER_DUPLICATE_USERNAME = orjson.dumps({
+    'username': 'testuser',  # Already exists
+    'email': 'different@example.com',
+    'password': 'NewPassword123!'
+})
+REGISTER_DUPLICATE_EMAIL = orjson.dumps({
+    'username': 'differentuser',
+    'email': 'test@example.com',  # Already exists
+    'password': 'NewPassword123!'
+})
+REGISTER_WEAK_PASSWORD = orjson.dumps({
+    'username': 'newuser',
+    'email': 'newuser@example.com',
+    'password': 'weak'  # Too weak
+})
+REGISTER_INVALID_EMAIL = orjson.dumps({
+    'username': 'newuser',
+    'email': 'notanemail',
+    'password': 'StrongPass123!'
+})
+REGISTER_MISSING_FIELDS = orjson.dumps({
+    'username': 'newuser'
+    # Missing email and password
+})
+LOGIN_TESTUSER = orjson.dumps({
+    'username': 'testuser',
+    'password': 'TestPass123!'
+})
+LOGIN_TESTUSER_EMAIL = orjson.dumps({
+    'username': 'test@example.com',  # Email
+    'password': 'TestPass123!'
+})
+LOGIN_WRONG_PASSWORD = orjson.dumps({
+    'username': 'testuser',
+    'password': 'WrongPassword123!'
+})
+LOGIN_NONEXISTENT = orjson.dumps({
+    'username': 'nonexistent',
+    'password': 'SomePassword123!'
+})
+
+
+def _post_json(client, url, body):
+    """POST pre-encoded JSON bytes"""
+    return client.post(url, data=body, content_type='application/json')
+
+
 class TestRegistration:
     """Test user registration endpoint"""
     
     def test_register_success(self, client):
         """Test successful user registration"""
-        response = client.post('/auth/register', json={
-            'username': 'newuser',
-            'email': 'newuser@example.com',
-            'password': 'NewPassword123!'
-        })
+        response = _post_json(client, '/auth/register', REGISTER_NEWUSER)
         
         assert response.status_code == 201
         data = response.get_json()
@@ -33,11 +83,7 @@ class TestRegistration:
     
     def test_register_duplicate_username(self, client, sample_user):
         """Test registration with duplicate username"""
-        response = client.post('/auth/register', json={
-            'username': 'testuser',  # Already exists
-            'email': 'different@example.com',
-            'password': 'NewPassword123!'
-        })
+        response = _post_json(client, '/auth/register', REGISTER_DUPLICATE_USERNAME)
         
         assert response.status_code == 400
         data = response.get_json()
@@ -46,11 +92,7 @@ class TestRegistration:
     
     def test_register_duplicate_email(self, client, sample_user):
         """Test registration with duplicate email"""
-        response = client.post('/auth/register', json={
-            'username': 'differentuser',
-            'email': 'test@example.com',  # Already exists
-            'password': 'NewPassword123!'
-        })
+        response = _post_json(client, '/auth/register', REGISTER_DUPLICATE_EMAIL)
         
         assert response.status_code == 400
         data = response.get_json()
@@ -59,11 +101,7 @@ class TestRegistration:
     
     def test_register_weak_password(self, client):
         """Test registration with weak password"""
-        response = client.post('/auth/register', json={
-            'username': 'newuser',
-            'email': 'newuser@example.com',
-            'password': 'weak'  # Too weak
-        })
+        response = _post_json(client, '/auth/register', REGISTER_WEAK_PASSWORD)
         
         assert response.status_code == 400
         data = response.get_json()
@@ -71,22 +109,32 @@ class TestRegistration:
     
     def test_register_invalid_email(self, client):
         """Test registration with invalid email"""
-        response = client.post('/auth/register', json={
-            'username': 'newuser',
-            'email': 'notanemail',
-            'password': 'StrongPass123!'
-        })
+        response = _post_json(client, '/auth/register', REGISTER_INVALID_EMAIL)
         
         assert response.status_code == 400
     
     def test_register_missing_fields(self, client):
         """Test registration with missing required fields"""
-        response = client.post('/auth/register', json={
-            'username': 'newuser'
-            # Missing email and password
-        })
+        response = _post_json(client, '/auth/register', REGISTER_MISSING_FIELDS)
+        
+        assert response.status_code == 400
+    
+    @pytest.mark.parametrize('content_type', [
+        'application/json; charset=utf-8',
+        'application/vnd.api+json'
+    ])
+    def test_register_json_content_types(self, client, content_type):
+        """Test charset parameters and +json media types are accepted"""
+        response = client.post('/auth/register', data=REGISTER_NEWUSER, content_type=content_type)
+        
+        assert response.status_code == 201
+    
+    def test_register_not_json(self, client):
+        """Test a non-JSON Content-Type is rejected"""
+        response = client.post('/auth/register', data=REGISTER_NEWUSER, content_type='text/plain')
         
         assert response.status_code == 400
+        assert 'application/json' in response.get_json()['error']
 
 
 class TestLogin:
@@ -94,10 +142,7 @@ class TestLogin:
     
     def test_login_success(self, client, sample_user):
         """Test successful login"""
-        response = client.post('/auth/login', json={
-            'username': 'testuser',
-            'password': 'TestPass123!'
-        })
+        response = _post_json(client, '/auth/login', LOGIN_TESTUSER)
         
         assert response.status_code == 200
         data = response.get_json()
@@ -108,10 +153,7 @@ class TestLogin:
     
     def test_login_with_email(self, client, sample_user):
         """Test login using email instead of username"""
-        response = client.post('/auth/login', json={
-            'username': 'test@example.com',  # Email
-            'password': 'TestPass123!'
-        })
+        response = _post_json(client, '/auth/login', LOGIN_TESTUSER_EMAIL)
         
         assert response.status_code == 200
         data = response.get_json()
@@ -119,10 +161,7 @@ class TestLogin:
     
     def test_login_wrong_password(self, client, sample_user):
         """Test login with incorrect password"""
-        response = client.post('/auth/login', json={
-            'username': 'testuser',
-            'password': 'WrongPassword123!'
-        })
+        response = _post_json(client, '/auth/login', LOGIN_WRONG_PASSWORD)
         
         assert response.status_code == 401
         data = response.get_json()
@@ -130,10 +169,7 @@ class TestLogin:
     
     def test_login_nonexistent_user(self, client):
         """Test login with non-existent user"""
-        response = client.post('/auth/login', json={
-            'username': 'nonexistent',
-            'password': 'SomePassword123!'
-        })
+        response = _post_json(client, '/auth/login', LOGIN_NONEXISTENT)
         
         assert response.status_code == 401
         data = response.get_json()
@@ -146,10 +182,7 @@ class TestTokenRefresh:
     def test_refresh_token_success(self, client, sample_user):
         """Test successful token refresh"""
         # Login to get refresh token
-        login_response = client.post('/auth/login', json={
-            'username': 'testuser',
-            'password': 'TestPass123!'
-        })
+        login_response = _post_json(client, '/auth/login', LOGIN_TESTUSER)
         refresh_token = login_response.get_json()['data']['refresh_token']
         
         # Use refresh token to get new access token
@@ -0,0 +1,103 @@
+"""
+Integration tests for info and health endpoints
+
+Tests:
+- API home (ETag revalidation)
+- Health check
+- Liveness probe
+- Readiness probe (database up/down, TTL memoization)
+"""
+
+import pytest
+
+from db import db
+from routes.info_routes import READY_CHECK_TTL
+
+
+def _fail_connect(*args, **kwargs):
+    raise RuntimeError("database unreachable")
+
+
+@pytest.fixture
+def fresh_ready(app):
+    """Start each readiness test without a memoized result"""
+    app.extensions.pop('health_ready', None)
+    yield
+    app.extensions.pop('health_ready', None)
+
+
+class TestHome:
+    """Test the API information endpoint"""
+    
+    def test_home(self, client):
+        """Test home returns the API description with an ETag"""
+        response = client.get('/')
+        
+        assert response.status_code == 200
+        assert response.get_json()['version'] == '1.0.0'
+        assert response.headers['ETag']
+    
+    def test_home_not_modified(self, client):
+        """Test a matching If-None-Match returns 304 with no body"""
+        etag = client.get('/').headers['ETag']
+        
+        response = client.get('/', headers={'If-None-Match': etag})
+        
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+
+
+class TestHealth:
+    """Test /health, /health/live and /health/ready"""
+    
+    def test_health(self, client):
+        """Test the public health check doesn't expose pool internals"""
+        response = client.get('/health')
+        
+        assert response.status_code == 200
+        assert response.get_json() == {'status': 'healthy', 'database': 'connected'}
+    
+    def test_liveness(self, client):
+        """Test liveness never touches the database"""
+        response = client.get('/health/live')
+        
+        assert response.status_code == 200
+        assert response.get_json() == {'status': 'ok'}
+    
+    def test_readiness_ok(self, client, fresh_ready):
+        """Test readiness reports ready when the database answers"""
+        response = client.get('/health/ready')
+        
+        assert response.status_code == 200
+        assert response.get_json() == {'status': 'ready', 'database': 'connected'}
+    
+    def test_readiness_database_down(self, client, app, fresh_ready, monkeypatch):
+        """Test readiness returns 503 when the database can't be reached"""
+        with monkeypatch.context() as patch:
+            with app.app_context():
+                patch.setattr(db.engine, 'connect', _fail_connect)
+            
+            response = client.get('/health/ready')
+        
+        assert response.status_code == 503
+        data = response.get_json()
+        assert data['status'] == 'unavailable'
+        assert 'unreachable' in data['error']
+    
+    def test_readiness_result_memoized(self, client, app, fresh_ready, monkeypatch):
+        """Test a readiness result is reused for READY_CHECK_TTL seconds"""
+        assert client.get('/health/ready').status_code == 200
+        
+        with monkeypatch.context() as patch:
+            with app.app_context():
+                patch.setattr(db.engine, 'connect', _fail_connect)
+            
+            # Within the TTL the cached result answers, without touching the DB
+            assert client.get('/health/ready').status_code == 200
+            
+            # Age the cached result past the TTL: the next probe re-checks
+            checked_at, error = app.extensions['health_ready']
+            app.extensions['health_ready'] = (checked_at - READY_CHECK_TTL, error)
+            
+            assert client.get('/health/ready').status_code == 503
@@ -44,6 +44,20 @@ class TestPublicPostEndpoints:
         data = response.get_json()
         assert data['success'] is True
         assert data['data']['title'] == 'Test Post'
+        assert response.headers['Cache-Control'] == 'no-cache'
+    
+    def test_get_single_post_not_modified(self, client, sample_post):
+        """Test a matching If-None-Match returns 304"""
+        etag = client.get(f'/posts/{sample_post.id}').headers['ETag']
+        
+        response = client.get(
+            f'/posts/{sample_post.id}',
+            headers={'If-None-Match': etag}
+        )
+        
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['Cache-Control'] == 'no-cache'
     
     def test_get_nonexistent_post(self, client):
         """Test getting non-existent post"""
@@ -107,24 +121,11 @@ class TestProtectedPostEndpoints:
         assert data['success'] is True
         assert data['data']['title'] == 'Updated Title'
     
-    def test_update_other_user_post(self, client, sample_post):
+    def test_update_other_user_post(self, client, sample_post, other_user_token):
         """Test updating another user's post (should fail)"""
-        # Create different user and get their token
-        client.post('/auth/register', json={
-            'username': 'otheruser',
-            'email': 'other@example.com',
-            'password': 'OtherPass123!'
-        })
-        
-        login_response = client.post('/auth/login', json={
-            'username': 'otheruser',
-            'password': 'OtherPass123!'
-        })
-        other_token = login_response.get_json()['data']['access_token']
-        
         # Try to update original user's post
         response = client.put(f'/posts/{sample_post.id}',
-            headers={'Authorization': f'Bearer {other_token}'},
+            headers={'Authorization': f'Bearer {other_user_token}'},
             json={'title': 'Hacked Title'}
         )
         
@@ -142,24 +143,11 @@ class TestProtectedPostEndpoints:
         data = response.get_json()
         assert data['success'] is True
     
-    def test_delete_other_user_post_as_user(self, client, sample_post):
+    def test_delete_other_user_post_as_user(self, client, sample_post, other_user_token):
         """Test deleting another user's post as regular user (should fail)"""
-        # Create different user
-        client.post('/auth/register', json={
-            'username': 'otheruser',
-            'email': 'other@example.com',
-            'password': 'OtherPass123!'
-        })
-        
-        login_response = client.post('/auth/login', json={
-            'username': 'otheruser',
-            'password': 'OtherPass123!'
-        })
-        other_token = login_response.get_json()['data']['access_token']
-        
         # Try to delete original user's post
         response = client.delete(f'/posts/{sample_post.id}',
-            headers={'Authorization': f'Bearer {other_token}'}
+            headers={'Authorization': f'Bearer {other_user_token}'}
         )
         
         assert response.status_code == 403
@@ -182,31 +170,23 @@ class TestAdminPermissions:
 class TestPagination:
     """Test post pagination"""
     
-    def test_pagination_default(self, client, app):
+    def test_pagination_default(self, client, app, sample_user):
         """Test default pagination"""
-        # Create multiple posts
+        # Create multiple posts (author reuses the cached fixture hash)
         with app.app_context():
-            from models import User, Post
+            from sqlalchemy import insert
+            from models import Post
             from db import db
-            from utils.security import hash_password
-            
-            user = User(
-                username='paginationuser',
-                email='pagination@example.com',
-                password_hash=hash_password('TestPass123!'),
-                role='user'
-            )
-            db.session.add(user)
-            db.session.commit()
             
-            # Create 15 posts
-            for i in range(15):
-                post = Post(
-                    title=f'Post {i}',
-                    content=f'Content for post {i} with enough characters here.',
-                    author_id=user.id
-                )
-                db.session.add(post)
+            # Create 15 posts in one executemany INSERT
+            db.session.execute(insert(Post), [
+                {
+                    'title': f'Post {i}',
+                    'content': f'Content for post {i} with enough characters here.',
+                    'author_id': sample_user.id
+                }
+                for i in range(15)
+            ])
             db.session.commit()
         
         response = client.get('/posts')
@@ -225,3 +205,39 @@ class TestPagination:
         data = response.get_json()
         assert data['data']['page'] == 2
         assert data['data']['per_page'] == 5
+    
+    def test_pagination_keyset_cursor(self, client, app, sample_user):
+        """Test walking pages with the after cursor"""
+        with app.app_context():
+            from sqlalchemy import insert
+            from models import Post
+            from db import db
+            
+            db.session.execute(insert(Post), [
+                {
+                    'title': f'Post {i}',
+                    'content': f'Content for post {i} with enough characters here.',
+                    'author_id': sample_user.id
+                }
+                for i in range(7)
+            ])
+            db.session.commit()
+        
+        first = client.get('/posts?per_page=5').get_json()['data']
+        cursor = f"{first['items'][-1]['created_at']},{first['items'][-1]['id']}"
+        assert first['next_after'] == cursor
+        
+        response = client.get(f'/posts?per_page=5&after={cursor}')
+        
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert len(data['items']) == 2
+        assert data['next_after'] is None
+        seen = {p['id'] for p in first['items']} | {p['id'] for p in data['items']}
+        assert len(seen) == 7
+    
+    def test_pagination_invalid_cursor(self, client):
+        """Test malformed after cursor is rejected"""
+        response = client.get('/posts?after=not-a-cursor')
+        
+        assert response.status_code == 400
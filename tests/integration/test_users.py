@@ -0,0 +1,89 @@
+"""
+Integration tests for user profile endpoints
+
+Tests:
+- Getting own profile
+- Updating own profile
+- Inactive accounts are rejected
+- Deactivating an account
+"""
+
+import pytest
+
+
+def _deactivate(app, user):
+    """Mark a fixture user inactive directly in the database"""
+    with app.app_context():
+        from sqlalchemy import update
+        from models import User
+        from db import db
+        
+        db.session.execute(
+            update(User).where(User.id == user.id).values(is_active=False)
+        )
+        db.session.commit()
+
+
+class TestProfile:
+    """Test /users/me endpoints"""
+    
+    def test_get_profile(self, client, auth_headers):
+        """Test getting own profile"""
+        response = client.get('/users/me', headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['data']['username'] == 'testuser'
+    
+    def test_update_profile_inactive_user(self, client, app, sample_user, auth_headers):
+        """Test a deactivated account can't update its profile with an old token"""
+        _deactivate(app, sample_user)
+        
+        response = client.put('/users/me',
+            headers=auth_headers,
+            json={'email': 'changed@example.com'}
+        )
+        
+        assert response.status_code == 401
+        data = response.get_json()
+        assert data['success'] is False
+        
+        with app.app_context():
+            from models import User
+            from db import db
+            
+            assert db.session.get(User, sample_user.id).email == 'test@example.com'
+
+
+class TestDeactivation:
+    """Test UserService.deactivate_user"""
+    
+    def test_deactivate_user(self, client, app, sample_user, auth_headers):
+        """Test deactivation clears is_active and locks out existing tokens"""
+        with app.app_context():
+            from services import UserService
+            
+            user = UserService.deactivate_user(sample_user.id)
+            assert user.is_active is False
+        
+        response = client.get('/users/me', headers=auth_headers)
+        
+        assert response.status_code == 401
+        assert response.get_json()['success'] is False
+        
+        # Logging in again doesn't get a fresh token either
+        response = client.post('/auth/login', json={
+            'username': 'testuser',
+            'password': 'TestPass123!'
+        })
+        
+        assert response.status_code == 401
+    
+    def test_deactivate_missing_user(self, app):
+        """Test deactivating an unknown user raises UserNotFoundError"""
+        with app.app_context():
+            from services import UserService
+            from config import UserNotFoundError
+            
+            with pytest.raises(UserNotFoundError):
+                UserService.deactivate_user(999)
@@ -0,0 +1,77 @@
+"""
+Unit tests for CORS handling
+
+Tests allowed origins, rejected origins, preflight and wildcard mode.
+"""
+
+import pytest
+from flask import Flask
+
+from config.cors import init_cors, ALLOWED_HEADERS, ALLOWED_METHODS
+
+
+def _make_app(origins):
+    """Minimal app with one route and the CORS hook"""
+    app = Flask(__name__)
+    app.config['CORS_ORIGINS'] = frozenset(origins)
+    
+    @app.route('/ping', methods=['GET', 'POST'])
+    def ping():
+        return {'ok': True}
+    
+    init_cors(app)
+    return app
+
+
+@pytest.fixture
+def cors_client():
+    """Client for an app that only allows https://app.example.com"""
+    return _make_app({'https://app.example.com'}).test_client()
+
+
+class TestCors:
+    """Test the after_request CORS hook"""
+    
+    def test_allowed_origin(self, cors_client):
+        """Test a whitelisted origin is echoed back with Vary: Origin"""
+        response = cors_client.get('/ping', headers={'Origin': 'https://app.example.com'})
+        
+        assert response.headers['Access-Control-Allow-Origin'] == 'https://app.example.com'
+        assert response.headers['Access-Control-Allow-Headers'] == ALLOWED_HEADERS
+        assert response.headers['Access-Control-Allow-Methods'] == ALLOWED_METHODS
+        assert 'Origin' in response.headers['Vary']
+    
+    def test_disallowed_origin(self, cors_client):
+        """Test other origins get no CORS headers"""
+        response = cors_client.get('/ping', headers={'Origin': 'https://evil.example.com'})
+        
+        assert response.status_code == 200
+        assert 'Access-Control-Allow-Origin' not in response.headers
+        assert 'Access-Control-Allow-Methods' not in response.headers
+    
+    def test_no_origin_header(self, cors_client):
+        """Test same-origin requests (no Origin header) are left alone"""
+        response = cors_client.get('/ping')
+        
+        assert 'Access-Control-Allow-Origin' not in response.headers
+    
+    def test_preflight(self, cors_client):
+        """Test an OPTIONS preflight from an allowed origin"""
+        response = cors_client.options('/ping', headers={
+            'Origin': 'https://app.example.com',
+            'Access-Control-Request-Method': 'POST',
+            'Access-Control-Request-Headers': 'Authorization, Content-Type'
+        })
+        
+        assert response.status_code == 200
+        assert response.headers['Access-Control-Allow-Origin'] == 'https://app.example.com'
+        assert response.headers['Access-Control-Allow-Methods'] == ALLOWED_METHODS
+        assert response.headers['Access-Control-Allow-Headers'] == ALLOWED_HEADERS
+    
+    def test_wildcard(self):
+        """Test '*' allows any origin without echoing it"""
+        client = _make_app({'*'}).test_client()
+        
+        response = client.get('/ping', headers={'Origin': 'https://any.example.com'})
+        
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
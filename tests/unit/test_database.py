@@ -0,0 +1,69 @@
+"""
+Unit tests for database helpers
+
+Tests mapping unique-constraint violations to the offending column.
+"""
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from db import db, violated_unique_column
+from models import User
+from config import DuplicateUserError
+from services import AuthService
+import services.auth_service as auth_service
+
+
+def _insert_user(username, email):
+    """Insert a user row outside the ORM session (like another worker would)"""
+    with db.engine.begin() as connection:
+        connection.execute(insert(User).values(
+            username=username,
+            email=email,
+            password_hash='x' * 60,
+            role='user',
+            is_active=True
+        ))
+
+
+class TestViolatedUniqueColumn:
+    """Test violated_unique_column on real IntegrityErrors"""
+    
+    @pytest.mark.parametrize('username, email, column', [
+        ('testuser', 'other@example.com', 'username'),
+        ('otheruser', 'test@example.com', 'email')
+    ])
+    def test_duplicate_column(self, app, sample_user, username, email, column):
+        """Test the violated column is named from the driver error"""
+        with app.app_context():
+            with pytest.raises(IntegrityError) as excinfo:
+                _insert_user(username, email)
+            
+            assert violated_unique_column(excinfo.value) == column
+
+
+class TestRegisterRace:
+    """Test a duplicate that slips past the register pre-check"""
+    
+    @pytest.mark.parametrize('username, email, field', [
+        ('racer', 'first@example.com', 'username'),
+        ('first', 'racer@example.com', 'email')
+    ])
+    def test_integrity_error_maps_to_field(self, app, monkeypatch, username, email, field):
+        """Test the INSERT's IntegrityError becomes DuplicateUserError(field)"""
+        real_hash = auth_service.hash_password
+        
+        def hash_after_concurrent_insert(password):
+            # Another request registers the same username/email while
+            # this one is hashing, after the pre-check already passed
+            _insert_user('racer', 'racer@example.com')
+            return real_hash(password)
+        
+        monkeypatch.setattr(auth_service, 'hash_password', hash_after_concurrent_insert)
+        
+        with app.app_context():
+            with pytest.raises(DuplicateUserError) as excinfo:
+                AuthService.register_user(username, email, 'StrongPass123!')
+        
+        assert excinfo.value.field == field
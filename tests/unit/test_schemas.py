@@ -0,0 +1,35 @@
+"""
+Unit tests for request schemas
+
+Tests email validation and normalization.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from schemas import UserRegister, UserUpdate
+
+
+class TestEmailValidation:
+    """Test the email field shared by UserRegister and UserUpdate"""
+    
+    def test_email_lowercased(self):
+        """Test a valid email is normalized to lowercase"""
+        user = UserRegister(
+            username='newuser',
+            email='John@Example.COM',
+            password='StrongPass123!'
+        )
+        
+        assert user.email == 'john@example.com'
+    
+    @pytest.mark.parametrize('email', [
+        'john@example.com\n',
+        'john@example.com\nx',
+        'notanemail',
+        'john@example'
+    ])
+    def test_invalid_email_rejected(self, email):
+        """Test malformed emails, including a trailing newline, are rejected"""
+        with pytest.raises(ValidationError):
+            UserUpdate(email=email)
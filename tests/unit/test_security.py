@@ -55,3 +55,29 @@ class TestPasswordHashing:
             # But both should verify
             assert verify_password(password, hash1) is True
             assert verify_password(password, hash2) is True
+    
+    def test_verify_malformed_hash(self):
+        """Test malformed hashes are rejected instead of raising"""
+        assert verify_password("TestPassword123!", "") is False
+        assert verify_password("TestPassword123!", "not-a-bcrypt-hash") is False
+        assert verify_password("TestPassword123!", "$1$" + "x" * 57) is False
+    
+    def test_hash_uses_configured_rounds(self, app):
+        """Test the cost factor comes from BCRYPT_LOG_ROUNDS (4 under testing)"""
+        with app.app_context():
+            hashed = hash_password("TestPassword123!")
+            
+            assert hashed.startswith(f"$2b${app.config['BCRYPT_LOG_ROUNDS']:02d}$")
+            assert app.config['BCRYPT_LOG_ROUNDS'] == 4
+    
+    def test_low_rounds_ignored_outside_testing(self, app, caplog):
+        """Test the test-only cost factor never reaches a non-testing app"""
+        with app.app_context():
+            app.config['TESTING'] = False
+            try:
+                hashed = hash_password("TestPassword123!")
+            finally:
+                app.config['TESTING'] = True
+            
+            assert hashed.startswith("$2b$12$")
+            assert "BCRYPT_LOG_ROUNDS=4 is below the minimum" in caplog.text
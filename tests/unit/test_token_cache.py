@@ -0,0 +1,54 @@
+"""
+Unit tests for the JWT token cache
+
+Tests hits, expiry and LRU eviction.
+"""
+
+import time
+
+from middleware.token_cache import TokenCache
+
+
+class TestTokenCache:
+    """Test TokenCache behaviour"""
+    
+    def test_returns_cached_claims(self):
+        """Test a cached token is returned as a copy"""
+        cache = TokenCache(ttl_seconds=60, max_size=10)
+        claims = {'sub': '1', 'exp': time.time() + 300}
+        
+        cache.set('token-a', claims)
+        cached = cache.get('token-a')
+        
+        assert cached == claims
+        assert cached is not claims
+        assert cache.get('token-b') is None
+    
+    def test_expired_token_is_dropped(self):
+        """Test entries past the token's exp are not returned"""
+        cache = TokenCache(ttl_seconds=60, max_size=10)
+        cache.set('token-a', {'sub': '1', 'exp': time.time() - 1})
+        
+        assert cache.get('token-a') is None
+        assert len(cache) == 0
+    
+    def test_token_without_exp_not_cached(self):
+        """Test tokens without an exp claim are never cached"""
+        cache = TokenCache(ttl_seconds=60, max_size=10)
+        cache.set('token-a', {'sub': '1'})
+        
+        assert cache.get('token-a') is None
+    
+    def test_least_recently_used_evicted(self):
+        """Test the oldest entry is evicted when full"""
+        cache = TokenCache(ttl_seconds=60, max_size=2)
+        exp = time.time() + 300
+        
+        cache.set('token-a', {'sub': '1', 'exp': exp})
+        cache.set('token-b', {'sub': '2', 'exp': exp})
+        cache.get('token-a')  # token-b is now least recently used
+        cache.set('token-c', {'sub': '3', 'exp': exp})
+        
+        assert cache.get('token-a') is not None
+        assert cache.get('token-b') is None
+        assert cache.get('token-c') is not None
@@ -2,14 +2,33 @@
 Utilities package - Helper functions and utilities
 """
 
-from .responses import create_success_response, create_error_response
+from .responses import (
+    create_success_response,
+    create_data_response,
+    create_error_response,
+    error_body,
+    fast_token_response
+)
 from .security import hash_password, verify_password
-from .validators import validate_pagination
+from .validators import (
+    validate_pagination,
+    parse_keyset_cursor,
+    is_json_request,
+    format_validation_errors
+)
+from .json_provider import OrjsonProvider
 
 __all__ = [
     'create_success_response',
+    'create_data_response',
     'create_error_response',
+    'error_body',
+    'fast_token_response',
     'hash_password',
     'verify_password',
-    'validate_pagination'
+    'validate_pagination',
+    'parse_keyset_cursor',
+    'is_json_request',
+    'format_validation_errors',
+    'OrjsonProvider'
 ]
\ No newline at end of file
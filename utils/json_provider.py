@@ -0,0 +1,40 @@
+"""
+JSON provider - orjson-backed serialization for Flask
+
+Replaces Flask's stdlib-json provider so jsonify(), request.get_json()
+and every route response go through orjson.
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Allow int/enum dict keys like the stdlib encoder does
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider using orjson
+    
+    datetime values are emitted as ISO 8601 strings (orjson native);
+    anything orjson can't handle falls back to Flask's default hook.
+    """
+    
+    # Compact, insertion-ordered output everywhere (Flask 3 reads these
+    # from the provider; the old JSON_SORT_KEYS/JSONIFY_* config is gone)
+    sort_keys = False
+    compact = True
+    mimetype = 'application/json'
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
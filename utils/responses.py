@@ -4,8 +4,41 @@ Response utilities - Helper functions for API responses
 Provides standardized success and error response formats.
 """
 
-from flask import jsonify
+from flask import current_app, g
+from pydantic import BaseModel
 from typing import Any, Optional
+import orjson
+
+from .json_provider import ORJSON_OPTIONS
+
+
+def error_body(message: str) -> bytes:
+    """
+    Encode an error payload in the create_error_response format
+    
+    Args:
+        message: Error message
+        
+    Returns:
+        JSON-encoded {"success": false, "error": message}
+    """
+    return orjson.dumps({'success': False, 'error': message})
+
+
+# Bodies with no variable data, encoded once at import
+_EMPTY_OK_BODY = orjson.dumps({'success': True})
+_STATIC_ERROR_BODIES = {
+    message: error_body(message)
+    for message in (
+        "Account is inactive",
+        "Admin access required",
+        "Authentication required",
+        "Content-Type must be application/json",
+        "Invalid or expired refresh token",
+        "Invalid or expired token",
+        "Invalid username or password"
+    )
+}
 
 
 def create_success_response(
@@ -24,19 +57,116 @@ def create_success_response(
     Returns:
         Tuple of (JSON response, status code)
     """
+    # Bare {"success": true}: nothing to serialize
+    if data is None and not message:
+        return _bytes_response(_EMPTY_OK_BODY), status_code
+    
     response = {'success': True}
     
     if message:
         response['message'] = message
     
+    # Let db flag queries issued while serializing (strict configs only)
+    if current_app.config.get('SQLALCHEMY_RAISE_ON_LAZY_LOAD', False):
+        g._in_serialization = True
+        try:
+            return _build_success_response(response, data, status_code)
+        finally:
+            g._in_serialization = False
+    
+    return _build_success_response(response, data, status_code)
+
+
+def create_data_response(data: dict, status_code: int = 200):
+    """
+    Success response for a plain dict payload with no message
+    
+    Specialized create_success_response for the common case: the envelope
+    is built in one literal, with no message/model branches and no
+    serialization-guard bookkeeping (a ready dict can't lazy-load).
+    
+    Args:
+        data: JSON-serializable response data
+        status_code: HTTP status code (default: 200)
+        
+    Returns:
+        Tuple of (JSON response, status code)
+    """
+    return _json_response({'success': True, 'data': data}), status_code
+
+
+def _build_success_response(response: dict, data: Any, status_code: int):
+    """Serialize `data` into the success envelope"""
+    if isinstance(data, BaseModel):
+        # Let pydantic's serializer write the model and splice it into the
+        # envelope, skipping model_dump() and a second encoding pass
+        envelope = orjson.dumps(response)
+        body = b''.join((
+            envelope[:-1],
+            b',"data":',
+            data.model_dump_json(by_alias=True).encode('utf-8'),
+            b'}'
+        ))
+        return current_app.response_class(body, mimetype='application/json'), status_code
+    
     if data is not None:
-        # If data is a Pydantic model, convert to dict
-        if hasattr(data, 'model_dump'):
-            response['data'] = data.model_dump()
-        else:
-            response['data'] = data
+        response['data'] = data
+    
+    return _json_response(response), status_code
+
+
+def _json_response(obj: dict):
+    """
+    Encode `obj` straight to a JSON response
+    
+    Same output as jsonify() with the orjson provider, minus its argument
+    handling and provider dispatch.
+    """
+    return _bytes_response(
+        orjson.dumps(obj, default=current_app.json.default, option=ORJSON_OPTIONS)
+    )
+
+
+def _bytes_response(body: bytes):
+    """Wrap an already-encoded JSON body in a response"""
+    return current_app.response_class(body, mimetype='application/json')
+
+
+def fast_token_response(
+    access_token: str,
+    refresh_token: str,
+    user: Any,
+    expires_in: int = 900
+) -> dict:
+    """
+    Build the TokenResponse payload straight from a trusted User
+    
+    Same shape as schemas.TokenResponse, without constructing the schema.
+    Only use with a user just loaded from or written to the database.
     
-    return jsonify(response), status_code
+    Args:
+        access_token: Encoded JWT access token
+        refresh_token: Encoded JWT refresh token
+        user: User model instance
+        expires_in: Access token lifetime in seconds
+        
+    Returns:
+        Dictionary ready for create_success_response
+    """
+    return {
+        'access_token': access_token,
+        'refresh_token': refresh_token,
+        'token_type': 'Bearer',
+        'expires_in': expires_in,
+        'user': {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'role': user.role,
+            'is_active': user.is_active,
+            'created_at': user.created_at.isoformat()
+        }
+    }
 
 
 def create_error_response(
@@ -53,7 +183,12 @@ def create_error_response(
     Returns:
         Tuple of (JSON response, status code)
     """
-    return jsonify({
-        'success': False,
-        'error': str(error)
-    }), status_code
+    message = str(error)
+    
+    # Fixed messages are pre-encoded; anything else (often carrying user
+    # input) is encoded on the spot
+    body = _STATIC_ERROR_BODIES.get(message)
+    if body is None:
+        body = error_body(message)
+    
+    return _bytes_response(body), status_code
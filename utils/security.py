@@ -3,11 +3,22 @@ Security utilities - Password hashing and verification
 
 Uses bcrypt for secure password hashing.
 NEVER store plain text passwords!
+
+bcrypt releases the GIL while hashing, so under gunicorn's gthread
+workers concurrent logins already run in parallel.
 """
 
 import bcrypt
 from flask import current_app
 
+# Lowest cost factor accepted outside TESTING; cheaper hashes are test-only
+_MIN_ROUNDS = 10
+_DEFAULT_ROUNDS = 12
+
+# Well-formed bcrypt hashes: "$2a$/$2b$/$2y$" prefix, 60 characters
+_BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+_BCRYPT_HASH_LENGTH = 60
+
 
 def hash_password(password: str) -> str:
     """
@@ -24,8 +35,16 @@ def hash_password(password: str) -> str:
         >>> print(hashed)
         $2b$12$...
     """
-    # Get bcrypt rounds from config (default: 12)
-    rounds = current_app.config.get('BCRYPT_LOG_ROUNDS', 12)
+    # Get bcrypt rounds from config (default: 12); the cheap test cost
+    # factor is honoured only when TESTING, never in a real deployment
+    config = current_app.config
+    rounds = config.get('BCRYPT_LOG_ROUNDS', _DEFAULT_ROUNDS)
+    if rounds < _MIN_ROUNDS and not config.get('TESTING'):
+        current_app.logger.warning(
+            "BCRYPT_LOG_ROUNDS=%s is below the minimum of %s outside TESTING; using %s",
+            rounds, _MIN_ROUNDS, _DEFAULT_ROUNDS
+        )
+        rounds = _DEFAULT_ROUNDS
     
     # Hash password
     password_bytes = password.encode('utf-8')
@@ -54,7 +73,13 @@ def verify_password(password: str, password_hash: str) -> bool:
         >>> verify_password("WrongPassword", hashed)
         False
     """
+    # Reject malformed hashes before running the KDF (checkpw would raise)
+    if (
+        len(password_hash) != _BCRYPT_HASH_LENGTH
+        or not password_hash.startswith(_BCRYPT_PREFIXES)
+    ):
+        return False
+    
     password_bytes = password.encode('utf-8')
     hash_bytes = password_hash.encode('utf-8')
-    
     return bcrypt.checkpw(password_bytes, hash_bytes)
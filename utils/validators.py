@@ -2,9 +2,40 @@
 Validation utilities - Helper functions for input validation
 """
 
+from datetime import datetime
+
 from config import ValidationError
 
 
+def _parse_int(value, default: int, label: str, field: str, maximum: int = None) -> int:
+    """
+    Convert one pagination parameter to a bounded positive int
+    
+    Ints (what routes pass via request.args type=int) and digit strings
+    skip int()'s exception machinery; anything else takes the slow path.
+    
+    Raises:
+        ValidationError: If the value is not a number or is out of range
+    """
+    if value is None:
+        number = default
+    elif type(value) is int:
+        number = value
+    elif type(value) is str and value.isdigit():
+        number = int(value)
+    else:
+        try:
+            number = int(value)
+        except (ValueError, TypeError):
+            raise ValidationError(f"{label} must be a number", field=field)
+    
+    if number < 1:
+        raise ValidationError(f"{label} must be >= 1", field=field)
+    if maximum is not None and number > maximum:
+        raise ValidationError(f"{label} must be <= {maximum}", field=field)
+    return number
+
+
 def validate_pagination(page: int = None, per_page: int = None) -> tuple:
     """
     Validate and normalize pagination parameters
@@ -19,26 +50,60 @@ def validate_pagination(page: int = None, per_page: int = None) -> tuple:
     Raises:
         ValidationError: If parameters are invalid
     """
-    # Default values
-    page = page if page is not None else 1
-    per_page = per_page if per_page is not None else 10
+    page = _parse_int(page, 1, "Page", "page")
+    per_page = _parse_int(per_page, 10, "Per page", "per_page", maximum=100)
     
-    # Validate page
-    try:
-        page = int(page)
-        if page < 1:
-            raise ValidationError("Page must be >= 1", field="page")
-    except (ValueError, TypeError):
-        raise ValidationError("Page must be a number", field="page")
+    return page, per_page
+
+
+def parse_keyset_cursor(cursor: str) -> tuple:
+    """
+    Parse a keyset pagination cursor of the form "<created_at>,<id>"
     
-    # Validate per_page
+    Args:
+        cursor: Cursor string (ISO 8601 timestamp and row ID)
+        
+    Returns:
+        Tuple of (created_at, id)
+        
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    created_at, sep, row_id = cursor.rpartition(',')
     try:
-        per_page = int(per_page)
-        if per_page < 1:
-            raise ValidationError("Per page must be >= 1", field="per_page")
-        if per_page > 100:
-            raise ValidationError("Per page must be <= 100", field="per_page")
-    except (ValueError, TypeError):
-        raise ValidationError("Per page must be a number", field="per_page")
+        if not sep:
+            raise ValueError(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except ValueError:
+        raise ValidationError("After must be '<created_at>,<id>'", field="after")
+
+
+def is_json_request(request) -> bool:
+    """
+    Check whether a request declares a JSON body
     
-    return page, per_page
+    Args:
+        request: Flask request
+        
+    Returns:
+        True if the Content-Type is application/json or application/*+json
+    """
+    return request.is_json
+
+
+def format_validation_errors(error) -> str:
+    """
+    Format a pydantic ValidationError as "field: message; ..."
+    
+    Args:
+        error: pydantic.ValidationError
+        
+    Returns:
+        Single error string
+    """
+    # Skip the docs URL/context/input pydantic would otherwise build per error
+    details = error.errors(include_url=False, include_context=False, include_input=False)
+    # Body-level errors (e.g. malformed JSON) have no field location
+    return '; '.join([
+        f"{err['loc'][0] if err['loc'] else 'body'}: {err['msg']}" for err in details
+    ])
@@ -0,0 +1,11 @@
+"""
+WSGI entry point
+
+Exposes the application built by the factory for production servers:
+
+    gunicorn -c gunicorn.conf.py
+"""
+
+from app import create_app
+
+application = create_app()